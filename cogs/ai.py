@@ -1,16 +1,59 @@
 import asyncio
+import hashlib
+import string
 import nextcord
 from nextcord.ext import commands
 import httpx
+import orjson
 import aiosqlite
 from colorama import Fore, init
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Deque, Dict, Set, Callable, Awaitable
 from cachetools import TTLCache
-from time import time
+from time import time, monotonic
 import random
+from collections import deque
+from utils.db import SQLITE_PRAGMAS
+
+# Semantic caching is optional: it needs numpy + sentence-transformers installed
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    from utils.semantic_cache import SemanticCache
+except ImportError:
+    SentenceTransformer = None
 
 init(autoreset=True)
 
+GROQ_MODEL = "llama3-8b-8192"
+GROQ_BASE_URL = "https://api.groq.com"
+GROQ_CHAT_PATH = "/openai/v1/chat/completions"
+HISTORY_TURNS = 3
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+SEMANTIC_CACHE_SIZE = 2048
+MAX_RETRIES = 3
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+MAX_CONCURRENT_COMPLETIONS = 16
+# Discord allows roughly 5 message edits per 5s, so don't push partial text faster than this
+STREAM_EDIT_INTERVAL = 1.0
+PROCESSED_TTL = 300
+LOG_BATCH_SIZE = 64
+LOG_FLUSH_INTERVAL = 0.5
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+_SCHEMA = SQLITE_PRAGMAS + """
+CREATE TABLE IF NOT EXISTS responses
+    (user_id INTEGER, question TEXT, answer TEXT, timestamp INTEGER);
+CREATE TABLE IF NOT EXISTS guild_settings
+    (guild_id INTEGER PRIMARY KEY, channel_id INTEGER, auto_response_enabled BOOLEAN);
+CREATE TABLE IF NOT EXISTS embedding_cache
+    (question TEXT PRIMARY KEY, answer TEXT, vec BLOB);
+CREATE INDEX IF NOT EXISTS idx_responses_user ON responses(user_id);
+CREATE INDEX IF NOT EXISTS idx_responses_ts ON responses(timestamp);
+"""
+
 MAYUMI_PERSONALITY = {
     "greetings": [
         "Hello! How can I help you today? (◕‿◕✿)",
@@ -39,57 +82,185 @@ I enjoy art, music, and having meaningful conversations. While I take my role as
 I try to keep things friendly and fun! Don't hesitate to ask me anything - I'm here to help! ╰(*°▽°*)╯""",
 }
 
+SYSTEM_PROMPT = (
+    "You are Mayumi, a friendly 22-year-old AI assistant. "
+    "You're cheerful, helpful, and occasionally use cute kaomoji emoticons."
+)
+# Built once so every request starts with a byte-identical prefix, which is what
+# Groq's prompt cache matches on. Per-call data only ever goes after this block.
+_STATIC_SYSTEM_BLOCK = {
+    "role": "system",
+    "content": MAYUMI_PERSONALITY["bio"] + "\n\n" + SYSTEM_PROMPT,
+}
+
+def _prompt_key(model: str, question: str) -> bytes:
+    """Hash a prompt so trivially different spellings share a cache slot."""
+    normalized = " ".join(question.lower().translate(_PUNCT_TABLE).split())
+    return hashlib.blake2b(f"{model}\0{normalized}".encode(), digest_size=16).digest()
+
 class AICog(commands.Cog):
-    def __init__(self, bot: commands.Bot, api_key: str, db_path: str = "db/ai_responses.db"):
+    def __init__(
+        self,
+        bot: commands.Bot,
+        api_key: str,
+        db_path: str = "db/ai_responses.db",
+        cache_responses: bool = True,
+    ):
         if not api_key:
             raise ValueError("API key must be provided")
 
         self.bot = bot
         self.api_key = api_key
         self.db_path = db_path
-        self.message_history: List[Tuple[str, str]] = []
-        self.processed_messages = TTLCache(maxsize=100, ttl=300)
-        self._settings_cache = TTLCache(maxsize=100, ttl=60)
+        # Last HISTORY_TURNS exchanges, already shaped as chat messages for the payload
+        self._history_msgs: Deque[dict] = deque(maxlen=2 * HISTORY_TURNS)
+        # Two generations of seen message IDs; an ID is remembered for
+        # between PROCESSED_TTL / 2 and PROCESSED_TTL seconds
+        self._processed_recent: Set[int] = set()
+        self._processed_old: Set[int] = set()
+        self._processed_rotated_at = monotonic()
+        # The whole guild_settings table, loaded once and kept in sync by set_guild_settings
+        self._settings: Dict[int, Tuple[int, bool]] = {}
+        self.cache_responses = cache_responses
+        self._response_cache = TTLCache(maxsize=1024, ttl=3600)
+        # Prompt key -> Future of the completion currently being fetched for it
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        # Shuffled phrase queues so canned replies cycle instead of repeating
+        self._phrases: Dict[str, Deque[str]] = {
+            k: deque(random.sample(v, len(v))) for k, v in MAYUMI_PERSONALITY.items() if isinstance(v, list)
+        }
+        self._phrase_uses: Dict[str, int] = dict.fromkeys(self._phrases, 0)
+        self._encoder = None
+        self._semantic_cache = None
+        self._db: Optional[aiosqlite.Connection] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._completion_slots = asyncio.Semaphore(MAX_CONCURRENT_COMPLETIONS)
+        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
 
         bot.loop.create_task(self.initialize())
 
     async def initialize(self):
+        # One connection for the cog's lifetime keeps SQLite's page cache warm
         self._db = await aiosqlite.connect(self.db_path)
-        await self._db.execute(
-            """CREATE TABLE IF NOT EXISTS responses
-            (user_id INTEGER, question TEXT, answer TEXT, timestamp INTEGER)"""
+        await self._db.executescript(_SCHEMA)
+        async with self._db.execute(
+            "SELECT guild_id, channel_id, auto_response_enabled FROM guild_settings"
+        ) as cursor:
+            self._settings = {row[0]: (row[1], bool(row[2])) async for row in cursor}
+        # HTTP/2 lets concurrent completions share one kept-alive TLS connection
+        self._http_client = httpx.AsyncClient(
+            base_url=GROQ_BASE_URL,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+        )
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+
+        if self.cache_responses and SentenceTransformer is not None:
+            await self.load_semantic_cache()
+
+    async def load_semantic_cache(self):
+        self._encoder = await asyncio.to_thread(SentenceTransformer, EMBEDDING_MODEL)
+        self._semantic_cache = SemanticCache(
+            self._encoder.get_sentence_embedding_dimension(),
+            maxsize=SEMANTIC_CACHE_SIZE,
+            threshold=SEMANTIC_THRESHOLD,
         )
+        async with self._db.execute(
+            "SELECT question, answer, vec FROM embedding_cache LIMIT ?", (SEMANTIC_CACHE_SIZE,)
+        ) as cursor:
+            async for question, answer, vec in cursor:
+                self._semantic_cache.add(question, answer, np.frombuffer(vec, dtype=np.float32))
+
+    async def remember_semantic(self, question: str, answer: str, vector):
+        evicted = self._semantic_cache.add(question, answer, vector)
+        if evicted is not None:
+            await self._db.execute("DELETE FROM embedding_cache WHERE question = ?", (evicted,))
         await self._db.execute(
-            """CREATE TABLE IF NOT EXISTS guild_settings
-            (guild_id INTEGER PRIMARY KEY, channel_id INTEGER, auto_response_enabled BOOLEAN)"""
+            "INSERT OR REPLACE INTO embedding_cache (question, answer, vec) VALUES (?, ?, ?)",
+            (question, answer, vector.astype(np.float32).tobytes()),
         )
         await self._db.commit()
-        self._http_client = httpx.AsyncClient(timeout=30.0)
+
+    async def _write_log_rows(self, rows: List[Tuple[int, str, str, int]]):
+        try:
+            await self._db.executemany(
+                "INSERT INTO responses (user_id, question, answer, timestamp) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            await self._db.commit()
+        except Exception as e:
+            print(f"{Fore.RED}[Mayumi] Failed to write {len(rows)} log rows: {e}")
+
+    async def _flush_loop(self):
+        """Drain logged interactions in batches so many messages share one commit."""
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await self._log_queue.get()]
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            try:
+                while len(rows) < LOG_BATCH_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        rows.append(await asyncio.wait_for(self._log_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                await self._write_log_rows(rows)
+                raise
+            await self._write_log_rows(rows)
 
     async def cleanup(self):
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        rows = []
+        while not self._log_queue.empty():
+            rows.append(self._log_queue.get_nowait())
+        if rows and self._db:
+            await self._write_log_rows(rows)
         if self._db:
             await self._db.close()
-        if hasattr(self, "_http_client"):
+        if self._http_client:
             await self._http_client.aclose()
 
     def cog_unload(self):
         asyncio.create_task(self.cleanup())
 
     def get_mayumi_response(self, response_type: str) -> str:
-        return random.choice(MAYUMI_PERSONALITY[response_type])
+        phrases = self._phrases[response_type]
+        phrase = phrases[0]
+        phrases.rotate(-1)
+        self._phrase_uses[response_type] += 1
+        if self._phrase_uses[response_type] % len(phrases) == 0:
+            # Reshuffle after every full cycle, without repeating the phrase just used
+            random.shuffle(phrases)
+            if phrases[0] == phrase:
+                phrases.rotate(-1)
+        return phrase
 
-    async def get_guild_settings(self, guild_id: int) -> Optional[Tuple[int, bool]]:
-        if guild_id in self._settings_cache:
-            return self._settings_cache[guild_id]
+    def already_processed(self, message_id: int) -> bool:
+        """Return whether we've seen `message_id` recently, marking it as seen."""
+        now = monotonic()
+        if now - self._processed_rotated_at >= PROCESSED_TTL / 2:
+            self._processed_old = self._processed_recent
+            self._processed_recent = set()
+            self._processed_rotated_at = now
 
-        async with self._db.execute(
-            """SELECT channel_id, auto_response_enabled FROM guild_settings WHERE guild_id = ?""",
-            (guild_id,),
-        ) as cursor:
-            settings = await cursor.fetchone()
-            if settings:
-                self._settings_cache[guild_id] = settings
-            return settings
+        if message_id in self._processed_recent or message_id in self._processed_old:
+            return True
+        self._processed_recent.add(message_id)
+        return False
+
+    def get_guild_settings(self, guild_id: int) -> Optional[Tuple[int, bool]]:
+        return self._settings.get(guild_id)
 
     async def set_guild_settings(self, guild_id: int, channel_id: int, auto_response_enabled: bool):
         await self._db.execute(
@@ -98,70 +269,171 @@ class AICog(commands.Cog):
             (guild_id, channel_id, auto_response_enabled),
         )
         await self._db.commit()
-        self._settings_cache[guild_id] = (channel_id, auto_response_enabled)
+        self._settings[guild_id] = (channel_id, bool(auto_response_enabled))
 
-    async def ask_ai(self, question: str) -> str:
-        system_prompt = (
-            """You are Mayumi, a friendly 22-year-old AI assistant. You're cheerful, helpful, and occasionally use cute kaomoji emoticons."""
-        )
+    async def ask_ai(
+        self, question: str, on_partial: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> str:
+        """Answer `question`, calling `on_partial` with the text so far while it streams in."""
+        if not self.cache_responses:
+            return await self._complete(question, None, on_partial)
+
+        key = _prompt_key(GROQ_MODEL, question)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
 
-        messages = [{"role": "system", "content": system_prompt}]
-        for q, a in self.message_history[-3:]:
-            messages.append({"role": "user", "content": q})
-            messages.append({"role": "assistant", "content": a})
+        # Someone already asked the same thing and the answer is on its way
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the error as retrieved so asyncio doesn't warn when nobody else was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            answer = await self._complete(question, key, on_partial)
+            future.set_result(answer)
+            return answer
+        except Exception as e:
+            # Waiters get the same error as us, so they send the usual error reply too
+            future.set_exception(e)
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+
+    async def _post_completion(self, body: bytes) -> dict:
+        """POST to Groq, retrying rate limits, 5xx and timeouts with jittered backoff."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._completion_slots:
+                    response = await self._http_client.post(GROQ_CHAT_PATH, content=body)
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRYABLE_STATUS or attempt == MAX_RETRIES:
+                    raise
+                retry_after = e.response.headers.get("retry-after")
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+                retry_after = None
+
+            try:
+                delay = min(float(retry_after), MAX_RETRY_DELAY)
+            except (TypeError, ValueError):
+                delay = min(RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY) + random.uniform(0, 0.5)
+            await asyncio.sleep(delay)
+
+    async def _stream_completion(self, body: bytes, on_partial: Callable[[str], Awaitable[None]]) -> str:
+        """Stream a completion over SSE, reporting the accumulated text every STREAM_EDIT_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        parts = []
+        last_report = loop.time()
+        async with self._completion_slots:
+            async with self._http_client.stream("POST", GROQ_CHAT_PATH, content=body) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    delta = orjson.loads(data)["choices"][0]["delta"].get("content")
+                    if not delta:
+                        continue
+                    parts.append(delta)
+                    now = loop.time()
+                    if now - last_report >= STREAM_EDIT_INTERVAL:
+                        last_report = now
+                        await on_partial("".join(parts))
+        return "".join(parts)
+
+    async def _complete(
+        self,
+        question: str,
+        key: Optional[bytes],
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> str:
+        vector = None
+        if key is not None and self._semantic_cache is not None:
+            vector = await asyncio.to_thread(self._encoder.encode, question, normalize_embeddings=True)
+            cached = self._semantic_cache.lookup(vector)
+            if cached is not None:
+                self._response_cache[key] = cached
+                return cached
+
+        messages = [_STATIC_SYSTEM_BLOCK]
+        messages.extend(self._history_msgs)
         messages.append({"role": "user", "content": question})
 
         payload = {
-            "model": "llama3-8b-8192",
+            "model": GROQ_MODEL,
             "messages": messages,
             "temperature": 0.7,
             "max_tokens": 500,
         }
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+
+        answer = None
+        if on_partial is not None:
+            try:
+                answer = await self._stream_completion(orjson.dumps({**payload, "stream": True}), on_partial)
+            except (httpx.HTTPError, KeyError, IndexError, orjson.JSONDecodeError) as e:
+                # Fall back to a plain request, which gets the retry/backoff handling
+                print(f"{Fore.YELLOW}[Mayumi] Streaming failed, retrying without it: {e}")
 
         try:
-            response = await self._http_client.post(
-                "https://api.groq.com/openai/v1/chat/completions", headers=headers, json=payload
-            )
-            response.raise_for_status()
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+            if not answer:
+                result = await self._post_completion(orjson.dumps(payload))
+                answer = result["choices"][0]["message"]["content"]
         except Exception as e:
             print(f"{Fore.RED}[Mayumi] Error: {e}")
             return self.get_mayumi_response("error_messages")
 
+        if key is not None:
+            self._response_cache[key] = answer
+        if vector is not None:
+            await self.remember_semantic(question, answer, vector)
+        return answer
+
     async def log_interaction(self, user_id: int, question: str, answer: str):
-        self.message_history.append((question, answer))
-        if len(self.message_history) > 5:
-            self.message_history.pop(0)
+        self._history_msgs.append({"role": "user", "content": question})
+        self._history_msgs.append({"role": "assistant", "content": answer})
 
-        await self._db.execute(
-            "INSERT INTO responses (user_id, question, answer, timestamp) VALUES (?, ?, ?, ?)",
-            (user_id, question, answer, int(time())),
-        )
-        await self._db.commit()
+        self._log_queue.put_nowait((user_id, question, answer, int(time())))
 
     @commands.Cog.listener()
     async def on_message(self, message: nextcord.Message):
         if message.author.bot or not message.guild:
             return
-
-        if message.id in self.processed_messages:
+        settings = self._settings.get(message.guild.id)
+        if not settings or settings[0] != message.channel.id or not settings[1]:
             return
-        self.processed_messages[message.id] = True
 
-        settings = await self.get_guild_settings(message.guild.id)
-        if not settings or settings[0] != message.channel.id or not settings[1]:
+        if self.already_processed(message.id):
             return
 
+        prompt = message.content
+        reply: Optional[nextcord.Message] = None
+
+        async def show_partial(text: str):
+            nonlocal reply
+            if reply is None:
+                reply = await message.channel.send(text)
+            else:
+                await reply.edit(content=text)
+
         async with message.channel.typing():
             try:
-                answer = await self.ask_ai(message.content)
-                await self.log_interaction(message.author.id, message.content, answer)
-                await message.channel.send(answer)
+                answer = await self.ask_ai(prompt, on_partial=show_partial)
+                await self.log_interaction(message.author.id, prompt, answer)
+                if reply is None:
+                    await message.channel.send(answer)
+                else:
+                    await reply.edit(content=answer)
             except Exception as e:
                 print(f"{Fore.RED}[Mayumi] Error: {e}")
                 await message.channel.send(self.get_mayumi_response("error_messages"))
@@ -2,14 +2,23 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import IntegrationType, Interaction, InteractionContextType
 from typing import Union
-from io import BytesIO
-import aiohttp
-from PIL import Image, ImageOps, ImageFilter
+from cachetools import TTLCache
 
 class Avatar(commands.Cog):
+    # (format, link label) pairs offered for every asset; GIF only when animated
+    _FORMATS = (('png', 'PNG'), ('jpg', 'JPG'), ('webp', 'WEBP'))
+    _FORMATS_ANIMATED = _FORMATS + (('gif', 'GIF'),)
+
     def __init__(self, bot):
         self.bot = bot
+        # Banners only come from a REST fetch, so keep recent ones for a few minutes
+        self._banner_cache = TTLCache(maxsize=1024, ttl=300)
         
+    def _render_format_links(self, asset: nextcord.Asset) -> str:
+        """Build the "[PNG](url) | [JPG](url) | ..." download links for an asset"""
+        formats = self._FORMATS_ANIMATED if asset.is_animated() else self._FORMATS
+        return " | ".join(f"[{label}]({asset.with_format(fmt).url})" for fmt, label in formats)
+
     async def get_avatar(self, user: nextcord.User, size: int = 1024) -> str:
         """Get user's avatar URL with specified size"""
         format = 'gif' if user.display_avatar.is_animated() else 'png'
@@ -64,16 +73,7 @@ class Avatar(commands.Cog):
         embed.set_image(url=avatar_url)
         
         # Add avatar links
-        formats = ['png', 'jpg', 'webp']
-        if user.display_avatar.is_animated():
-            formats.append('gif')
-            
-        links = []
-        for fmt in formats:
-            url = user.display_avatar.with_format(fmt).url
-            links.append(f"[{fmt.upper()}]({url})")
-            
-        embed.add_field(name="Links", value=" | ".join(links), inline=False)
+        embed.add_field(name="Links", value=self._render_format_links(user.display_avatar), inline=False)
         
         # Add some user info
         embed.add_field(
@@ -146,16 +146,7 @@ class Avatar(commands.Cog):
         embed.set_image(url=member.guild_avatar.url)
         
         # Add format links
-        formats = ['png', 'jpg', 'webp']
-        if member.guild_avatar.is_animated():
-            formats.append('gif')
-            
-        links = []
-        for fmt in formats:
-            url = member.guild_avatar.with_format(fmt).url
-            links.append(f"[{fmt.upper()}]({url})")
-            
-        embed.add_field(name="Links", value=" | ".join(links), inline=False)
+        embed.add_field(name="Links", value=self._render_format_links(member.guild_avatar), inline=False)
 
         if isinstance(ctx, nextcord.Interaction):
             await ctx.response.send_message(embed=embed)
@@ -193,7 +184,10 @@ class Avatar(commands.Cog):
     ):
         """Common function to handle banner display"""
         try:
-            fetched_user = await self.bot.fetch_user(user.id)
+            fetched_user = self._banner_cache.get(user.id)
+            if fetched_user is None:
+                fetched_user = await self.bot.fetch_user(user.id)
+                self._banner_cache[user.id] = fetched_user
             if not fetched_user.banner:
                 response = f"{user} doesn't have a banner!"
                 if isinstance(ctx, nextcord.Interaction):
@@ -207,16 +201,7 @@ class Avatar(commands.Cog):
             embed.set_image(url=fetched_user.banner.url)
             
             # Add format links
-            formats = ['png', 'jpg', 'webp']
-            if fetched_user.banner.is_animated():
-                formats.append('gif')
-                
-            links = []
-            for fmt in formats:
-                url = fetched_user.banner.with_format(fmt).url
-                links.append(f"[{fmt.upper()}]({url})")
-                
-            embed.add_field(name="Links", value=" | ".join(links), inline=False)
+            embed.add_field(name="Links", value=self._render_format_links(fetched_user.banner), inline=False)
             
             if isinstance(ctx, nextcord.Interaction):
                 await ctx.response.send_message(embed=embed)
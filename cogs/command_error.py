@@ -1,6 +1,19 @@
 from nextcord.ext import commands
+from functools import lru_cache
 import math
 
+@lru_cache(maxsize=64)
+def _format_retry(seconds: int) -> str:
+    """Turn a whole number of seconds into "1h 5m", "3m 20s" or "12s"."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    if minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
 class ErrorHandler(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -13,16 +26,7 @@ class ErrorHandler(commands.Cog):
             except Exception:
                 pass
         elif isinstance(error, commands.CommandOnCooldown):
-            retry_after = math.ceil(error.retry_after)
-            hours, remainder = divmod(retry_after, 3600)
-            minutes, seconds = divmod(remainder, 60)
-
-            if hours > 0:
-                time_left = f"{hours}h {minutes}m"
-            elif minutes > 0:
-                time_left = f"{minutes}m {seconds}s"
-            else:
-                time_left = f"{seconds}s"
+            time_left = _format_retry(math.ceil(error.retry_after))
 
             try:
                 await ctx.send(
@@ -34,4 +38,3 @@ class ErrorHandler(commands.Cog):
 
 def setup(bot):
     bot.add_cog(ErrorHandler(bot))
-
@@ -2,7 +2,9 @@ import nextcord
 from nextcord.ext import commands
 from utils.eco import EconomySystem
 import random
-from datetime import datetime
+
+# Bound once and reused for every "$1,234" in the embeds below
+_money = "${:,}".format
 
 class Economy(commands.Cog):
     def __init__(self, bot):
@@ -23,10 +25,10 @@ class Economy(commands.Cog):
             embed = nextcord.Embed(
                 title=f"💰 {target.display_name}'s Balance",
                 color=nextcord.Color.green(),
-                timestamp=datetime.utcnow()
+                timestamp=nextcord.utils.utcnow()
             )
-            embed.add_field(name="Wallet", value=f"${balance['wallet']:,}", inline=False)
-            embed.add_field(name="Bank", value=f"${balance['bank']:,}", inline=False)
+            embed.add_field(name="Wallet", value=_money(balance['wallet']), inline=False)
+            embed.add_field(name="Bank", value=_money(balance['bank']), inline=False)
             embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
             embed.set_thumbnail(url=target.avatar.url)
 
@@ -40,10 +42,10 @@ class Economy(commands.Cog):
         try:
             result = self.economy.claim_daily(ctx.author.id)
             embed = nextcord.Embed(title="✨ Daily Reward", color=0x3498db)
-            embed.add_field(name="Amount", value=f"${result['amount']:,}")
+            embed.add_field(name="Amount", value=_money(result['amount']))
             embed.add_field(name="Streak", value=f"{result['streak']} days")
             if result['streak_bonus'] > 0:
-                embed.add_field(name="Streak Bonus", value=f"${result['streak_bonus']:,}")
+                embed.add_field(name="Streak Bonus", value=_money(result['streak_bonus']))
             await ctx.send(embed=embed)
         except ValueError as e:
             await ctx.send(f"❌ {str(e)}")
@@ -53,19 +55,18 @@ class Economy(commands.Cog):
         """Deposit money into your bank"""
         try:
             if amount.lower() == "all":
-                balance = self.economy.get_balance(ctx.author.id)
-                amount = balance["wallet"]
+                amount, new_balance = self.economy.deposit_all(ctx.author.id)
+                if amount <= 0:
+                    return await ctx.send("❌ Amount must be positive!")
             else:
                 amount = int(amount)
-                
-            if amount <= 0:
-                return await ctx.send("❌ Amount must be positive!")
-                
-            new_balance = self.economy.deposit(ctx.author.id, amount)
+                if amount <= 0:
+                    return await ctx.send("❌ Amount must be positive!")
+                new_balance = self.economy.deposit(ctx.author.id, amount)
             embed = nextcord.Embed(title="🏦 Deposit Successful", color=0x2ecc71)
-            embed.add_field(name="Deposited", value=f"${amount:,}")
-            embed.add_field(name="New Wallet", value=f"${new_balance['wallet']:,}")
-            embed.add_field(name="New Bank", value=f"${new_balance['bank']:,}")
+            embed.add_field(name="Deposited", value=_money(amount))
+            embed.add_field(name="New Wallet", value=_money(new_balance['wallet']))
+            embed.add_field(name="New Bank", value=_money(new_balance['bank']))
             await ctx.send(embed=embed)
         except ValueError as e:
             await ctx.send(f"❌ {str(e)}")
@@ -75,19 +76,18 @@ class Economy(commands.Cog):
         """Withdraw money from your bank"""
         try:
             if amount.lower() == "all":
-                balance = self.economy.get_balance(ctx.author.id)
-                amount = balance["bank"]
+                amount, new_balance = self.economy.withdraw_all(ctx.author.id)
+                if amount <= 0:
+                    return await ctx.send("❌ Amount must be positive!")
             else:
                 amount = int(amount)
-                
-            if amount <= 0:
-                return await ctx.send("❌ Amount must be positive!")
-                
-            new_balance = self.economy.withdraw(ctx.author.id, amount)
+                if amount <= 0:
+                    return await ctx.send("❌ Amount must be positive!")
+                new_balance = self.economy.withdraw(ctx.author.id, amount)
             embed = nextcord.Embed(title="🏦 Withdrawal Successful", color=0x2ecc71)
-            embed.add_field(name="Withdrawn", value=f"${amount:,}")
-            embed.add_field(name="New Wallet", value=f"${new_balance['wallet']:,}")
-            embed.add_field(name="New Bank", value=f"${new_balance['bank']:,}")
+            embed.add_field(name="Withdrawn", value=_money(amount))
+            embed.add_field(name="New Wallet", value=_money(new_balance['wallet']))
+            embed.add_field(name="New Bank", value=_money(new_balance['bank']))
             await ctx.send(embed=embed)
         except ValueError as e:
             await ctx.send(f"❌ {str(e)}")
@@ -115,7 +115,7 @@ class Economy(commands.Cog):
             result = self.economy.buy_item(ctx.author.id, item_name)
             embed = nextcord.Embed(title="✅ Purchase Successful", color=0x2ecc71)
             embed.add_field(name="Item", value=result["item"])
-            embed.add_field(name="Price", value=f"${result['price']:,}")
+            embed.add_field(name="Price", value=_money(result['price']))
             
             # Handle role rewards if any
             if result["role_reward"]:
@@ -1,16 +1,41 @@
 import nextcord
 from nextcord.ext import commands
 import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 from collections import defaultdict
+from operator import itemgetter
+import heapq
+
+# Audit log entries requested per API call (Discord's maximum)
+AUDIT_LOG_PAGE = 100
+# Ranked rows computed up front; most people never page past the first few
+LEADERBOARD_PRELOAD = 50
+MEDALS = ("🥇", "🥈", "🥉")
 
 class EmojiLeaderboardView(nextcord.ui.View):
-    def __init__(self, emoji_data: List[tuple], per_page: int = 10):
+    def __init__(self, emoji_data: Dict[int, List[str]], per_page: int = 10):
         super().__init__(timeout=60)
         self.current_page = 0
-        self.emoji_data = emoji_data
+        self._source = emoji_data
+        # Top rows as (user_id, emoji_count, emoji_list), extended on demand
+        self.emoji_data: List[tuple] = []
         self.per_page = per_page
         self.max_pages = ((len(emoji_data) - 1) // per_page) + 1
+        # The data is fixed for the view's lifetime, so each page only needs rendering once
+        self._cached_embeds: List[Optional[nextcord.Embed]] = [None] * self.max_pages
+
+    def _ensure_ranked(self, page: int):
+        """Make sure the rows for `page` have been ranked."""
+        needed = min((page + 1) * self.per_page, len(self._source))
+        if len(self.emoji_data) >= needed:
+            return
+        size = max(needed, 2 * len(self.emoji_data), LEADERBOARD_PRELOAD)
+        # nlargest is stable like sorted(), so a bigger ranking keeps the same order for earlier rows
+        self.emoji_data = heapq.nlargest(
+            size,
+            ((user_id, len(emojis), emojis) for user_id, emojis in self._source.items()),
+            key=itemgetter(1),
+        )
 
     @nextcord.ui.button(emoji="⬅️", style=nextcord.ButtonStyle.blurple)
     async def previous_page(self, button: nextcord.ui.Button, interaction: nextcord.Interaction):
@@ -25,39 +50,34 @@ class EmojiLeaderboardView(nextcord.ui.View):
             await self.update_message(interaction)
 
     def create_embed(self) -> nextcord.Embed:
+        cached = self._cached_embeds[self.current_page]
+        if cached is not None:
+            return cached
+
+        self._ensure_ranked(self.current_page)
         start_idx = self.current_page * self.per_page
         end_idx = min(start_idx + self.per_page, len(self.emoji_data))
         
-        embed = nextcord.Embed(
-            title="🏆 Emoji Leaderboard",
-            description="Top emoji contributors in the server",
-            color=0x00ff00,
-            timestamp=datetime.datetime.now()
-        )
-
+        # One description line per user instead of a field each
+        lines = ["Top emoji contributors in the server\n"]
         for idx, (user_id, emoji_count, emoji_list) in enumerate(self.emoji_data[start_idx:end_idx], start=start_idx + 1):
-            medal = ""
-            if idx == 1:
-                medal = "🥇"
-            elif idx == 2:
-                medal = "🥈"
-            elif idx == 3:
-                medal = "🥉"
-            else:
-                medal = "◼️"
+            medal = MEDALS[idx - 1] if idx <= 3 else "◼️"
 
             # Display some of the emojis they added (up to 5)
-            emoji_preview = " ".join(str(emoji) for emoji in emoji_list[:5])
+            emoji_preview = " ".join(emoji_list[:5])
             if len(emoji_list) > 5:
                 emoji_preview += " ..."
 
-            embed.add_field(
-                name=f"{medal} Rank #{idx}",
-                value=f"<@{user_id}>\nEmojis Added: {emoji_count}\nRecent Additions: {emoji_preview}",
-                inline=False
-            )
+            lines.append(f"{medal} **#{idx}** <@{user_id}> — {emoji_count} added: {emoji_preview}")
 
+        embed = nextcord.Embed(
+            title="🏆 Emoji Leaderboard",
+            description="\n".join(lines),
+            color=0x00ff00,
+            timestamp=datetime.datetime.now()
+        )
         embed.set_footer(text=f"Page {self.current_page + 1}/{self.max_pages}")
+        self._cached_embeds[self.current_page] = embed
         return embed
 
     async def update_message(self, interaction: nextcord.Interaction):
@@ -67,18 +87,29 @@ class EmojiLeaderboard(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def fetch_emoji_data(self, guild: nextcord.Guild) -> Dict[int, List[nextcord.Emoji]]:
-        """Fetch emoji creation data from server audit logs"""
+    async def fetch_emoji_data(self, guild: nextcord.Guild) -> Dict[int, List[str]]:
+        """Fetch emoji creation data from server audit logs, as emoji mention strings per user"""
         emoji_data = defaultdict(list)
-        
+        # Only count emojis the server still has; deleted ones come back as bare Objects
+        guild_emoji_ids = {emoji.id for emoji in guild.emojis}
+
         try:
-            # Fetch audit logs for emoji creation
-            async for entry in guild.audit_logs(action=nextcord.AuditLogAction.emoji_create, limit=None):
-                if entry.user:  # Make sure we have a valid user
-                    # Store the actual emoji object
+            # Page through emoji creations newest-first, one full page per request
+            before = None
+            while True:
+                batch = [
+                    entry async for entry in guild.audit_logs(
+                        action=nextcord.AuditLogAction.emoji_create, limit=AUDIT_LOG_PAGE, before=before
+                    )
+                ]
+                for entry in batch:
                     target_emoji = entry.target
-                    if target_emoji and isinstance(target_emoji, nextcord.Emoji):
-                        emoji_data[entry.user.id].append(target_emoji)
+                    if entry.user and target_emoji is not None and target_emoji.id in guild_emoji_ids:
+                        emoji_data[entry.user.id].append(str(target_emoji))
+
+                if len(batch) < AUDIT_LOG_PAGE:
+                    break
+                before = batch[-1]
         except nextcord.Forbidden:
             return None
         
@@ -100,15 +131,8 @@ class EmojiLeaderboard(commands.Cog):
                 await ctx.send("No emoji creation data found in audit logs! 😢")
                 return
 
-            # Convert to list of tuples (user_id, emoji_count, emoji_list)
-            sorted_data = sorted(
-                [(user_id, len(emojis), emojis) for user_id, emojis in emoji_data.items()],
-                key=lambda x: x[1],
-                reverse=True
-            )
-
-            # Create and send the paginated view
-            view = EmojiLeaderboardView(sorted_data)
+            # Create and send the paginated view; it ranks users as pages are viewed
+            view = EmojiLeaderboardView(emoji_data)
             await ctx.send(embed=view.create_embed(), view=view)
 
     @show_leaderboard.error
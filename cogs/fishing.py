@@ -1,14 +1,21 @@
 import nextcord
 from nextcord.ext import commands
 import random
+import re
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from bisect import bisect, bisect_right
+from collections import defaultdict
 from typing import Tuple
 import logging
 import traceback
+from cachetools import LRUCache, TTLCache
 from utils.fish_data import tiers, fish_data, modifiers, special_events
 from utils.eco import EconomySystem
 
 # Set up logging
-import logging
 from colorama import Fore, Style
 
 # Define color mapping for log levels
@@ -40,6 +47,32 @@ handler = logging.StreamHandler()
 handler.setFormatter(ColorFormatter("%(asctime)s [%(levelname)s] %(message)s"))
 
 
+# Inventories are read per cast; a short TTL lets the "Fish Again" button reuse them
+USER_CACHE_TTL = 1.0
+COMBO_CACHE_SIZE = 10_000
+# The bonus in an "... Extra N coins!" special event
+_EXTRA_RE = re.compile(r"(\d+) coins!")
+
+def _parse_special_event(event: str) -> Tuple[str, str, int]:
+    """Split a special event string into (text, kind, bonus coins) once, up front."""
+    if "Double" in event:
+        return event, "double", 0
+    if "Triple" in event:
+        return event, "triple", 0
+    if "Extra" in event:
+        match = _EXTRA_RE.search(event)
+        if match:
+            return event, "extra", int(match.group(1))
+        logger.warning("Couldn't read a coin bonus from special event %r", event)
+    return event, "none", 0
+
+def _owned_relics(inventory: dict) -> frozenset:
+    """Relic keys in an inventory, normalized so "power relic" and "power_relic" match."""
+    return frozenset(
+        key.lower().replace(" ", "_") for key in inventory
+        if key.lower().endswith("relic")
+    )
+
 # Add these classes at the top level of your file, before the FishingSystem class:
 class FishButton(nextcord.ui.Button):
     def __init__(self, fishing_cog, original_ctx):
@@ -50,9 +83,10 @@ class FishButton(nextcord.ui.Button):
         )
         self.fishing_cog = fishing_cog
         self.original_ctx = original_ctx
+        self.author_id = original_ctx.author.id
 
     async def callback(self, interaction: nextcord.Interaction):
-        if interaction.user.id != self.original_ctx.author.id:
+        if interaction.user.id != self.author_id:
             await interaction.response.send_message("This button is not for you!", ephemeral=True)
             return
 
@@ -73,19 +107,44 @@ class FishingSystem(commands.Cog):
             self.economy = EconomySystem(db_path="db/economy.db")
             logger.info("Economy system initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize economy system: {str(e)}")
+            logger.error("Failed to initialize economy system: %s", e)
             raise
 
         # Verify data is loaded correctly
-        logger.info(f"Tiers loaded: {len(tiers)}")
-        logger.info(f"Fish data loaded: {len(fish_data)}")
-        logger.info(f"Modifiers loaded: {len(modifiers)}")
-        logger.info(f"Special events loaded: {len(special_events)}")
+        logger.info("Tiers loaded: %d", len(tiers))
+        logger.info("Fish data loaded: %d", len(fish_data))
+        logger.info("Modifiers loaded: %d", len(modifiers))
+        logger.info("Special events loaded: %d", len(special_events))
         
         self.tiers = tiers
         self.fish_data = fish_data
         self.modifiers = modifiers
         self.special_events = special_events
+        # Tier names with their cumulative weights, so a cast doesn't rebuild both lists.
+        # Most likely tiers first, so the common picks land at the front of the table
+        by_weight = sorted(tiers.items(), key=lambda item: item[1], reverse=True)
+        self._tier_names = tuple(name for name, _ in by_weight)
+        self._tier_cum_weights = list(accumulate(weight for _, weight in by_weight))
+        # Fish are numbered in data order: parallel name/min/max tables indexed by id,
+        # and tier -> ids of the fish in it
+        self._fish_names = tuple(fish_data)
+        self._fish_min = array("i", (data[0] for data in fish_data.values()))
+        self._fish_max = array("i", (data[1] for data in fish_data.values()))
+        by_tier = defaultdict(list)
+        for fish_id, data in enumerate(fish_data.values()):
+            by_tier[data[2]].append(fish_id)
+        self._fish_by_tier = {tier: tuple(ids) for tier, ids in by_tier.items()}
+        # Caught when a tier has no fish: the cheapest one there is
+        self._fallback_fish = min(range(len(self._fish_names)), key=self._fish_min.__getitem__)
+        # (name, value, inline) fields for !fishinfo, built on first use
+        self._fishinfo_fields = None
+        self._special_events = [_parse_special_event(event) for event in special_events]
+        # Modifiers as cumulative chance thresholds, so one random() roll picks at most one
+        self._mod_cum = list(accumulate(data['chance'] for data in modifiers.values()))
+        self._mod_info = [
+            (name, f"{data['prefix']} {{}} [{name.title()}]", data['multiplier'])
+            for name, data in modifiers.items()
+        ]
 
         # Add relic types and their effects
         self.relic_types = {
@@ -116,59 +175,76 @@ class FishingSystem(commands.Cog):
             }
         }
         
-        # Track combo counts for combo relic
-        self.combo_counts = {}
+        # Track combo counts for combo relic, bounded so idle users eventually drop out
+        self.combo_counts = LRUCache(maxsize=COMBO_CACHE_SIZE)
+        self._user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL)
+        self._rng = random.Random()
+        # EconomySystem holds a single SQLite connection, so its calls run on one worker thread
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fishing-db")
+
+    def cog_unload(self):
+        self._db_executor.shutdown(wait=False)
 
+    async def _run_db(self, fn, *args):
+        """Run a blocking economy call on the cog's database thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, fn, *args)
 
-    def apply_relic_effects(self, user_id: int, tier: str, base_earnings: int) -> Tuple[str, int, float]:
+
+    async def apply_relic_effects(self, user_id: int, tier: str, base_earnings: int) -> Tuple[str, int, float]:
         """Apply relic effects to fishing results"""
         try:
-            user_data = self.get_user_data(user_id)
+            relics = _owned_relics(await self.get_user_data(user_id))
             final_earnings = base_earnings
             cooldown_modifier = 1.0
             tier_modifier = 0
 
             # Apply Power Relic
-            if "power_relic" in user_data or "power relic" in user_data:
+            if "power_relic" in relics:
                 final_earnings *= self.relic_types["power_relic"]["multiplier"]
                 
             # Apply Lucky Relic
-            if "lucky_relic" in user_data:
+            if "lucky_relic" in relics:
                 tier_modifier += self.relic_types["lucky_relic"]["tier_bonus"]
                 
             # Apply Speed Relic
-            if "speed_relic" in user_data:
+            if "speed_relic" in relics:
                 cooldown_modifier -= self.relic_types["speed_relic"]["cooldown_reduction"]
                 
             # Apply Combo Relic
-            if "combo_relic" in user_data:
-                if user_id not in self.combo_counts:
-                    self.combo_counts[user_id] = 0
-                self.combo_counts[user_id] += 1
+            if "combo_relic" in relics:
+                combo = self.combo_counts[user_id] = self.combo_counts.get(user_id, 0) + 1
                 combo_bonus = min(
-                    self.combo_counts[user_id] * self.relic_types["combo_relic"]["base_multiplier"],
+                    combo * self.relic_types["combo_relic"]["base_multiplier"],
                     self.relic_types["combo_relic"]["max_multiplier"]
                 )
                 final_earnings = int(final_earnings * (1 + combo_bonus))
 
             return tier, final_earnings, cooldown_modifier
         except Exception as e:
-            logger.error(f"Error applying relic effects: {str(e)}")
+            logger.error("Error applying relic effects: %s", e)
             return tier, base_earnings, 1.0
 
-    def get_user_data(self, user_id: int):
+    def _load_user_data(self, user_id: int):
+        user_data = self.economy.get_inventory(user_id)
+        logger.debug("User %d data retrieved: %s", user_id, user_data)
+
+        # An empty inventory may just mean there's no row yet; a fresh row's inventory
+        # is '{}' too, so there's nothing to re-read after creating it
+        if not user_data and self.economy.add_user(user_id):
+            logger.info("Created new user %d", user_id)
+        return user_data
+
+    async def get_user_data(self, user_id: int):
+        user_data = self._user_cache.get(user_id)
+        if user_data is not None:
+            return user_data
+
         try:
-            user_data = self.economy.get_inventory(user_id)
-            logger.info(f"User {user_id} data retrieved: {user_data}")
-            
-            if not user_data:
-                logger.info(f"Creating new user {user_id}")
-                self.economy.add_user(user_id)
-                user_data = self.economy.get_inventory(user_id)
-                
+            user_data = await self._run_db(self._load_user_data, user_id)
+            self._user_cache[user_id] = user_data
             return user_data
         except Exception as e:
-            logger.error(f"Error getting user data: {str(e)}")
+            logger.error("Error getting user data: %s", e)
             raise
 
 
@@ -179,9 +255,10 @@ class FishingSystem(commands.Cog):
             label="🎣 Fish Again!",
             custom_id="fish_again"
         )
+        author_id = ctx.author.id
         
         async def button_callback(interaction: nextcord.Interaction):
-            if interaction.user.id != ctx.author.id:
+            if interaction.user.id != author_id:
                 await interaction.response.send_message("This button is not for you!", ephemeral=True)
                 return
                 
@@ -206,29 +283,29 @@ class FishingSystem(commands.Cog):
         button.callback = button_callback
         return button
 
-    def get_fish_by_tier(self, tier: str) -> str:
+    def get_fish_by_tier(self, tier: str) -> int:
+        """Pick the id of a random fish from `tier`."""
         try:
-            tier_fish = [(name, data) for name, data in self.fish_data.items()
-                        if data[2] == tier]
-            logger.info(f"Available fish in tier {tier}: {len(tier_fish)}")
-            
+            tier_fish = self._fish_by_tier.get(tier)
             if tier_fish:
-                return random.choice(tier_fish)[0]
-            return "🐟 Small Fish"
+                return self._rng.choice(tier_fish)
+            return self._fallback_fish
         except Exception as e:
-            logger.error(f"Error in get_fish_by_tier: {str(e)}")
-            return "🐟 Small Fish"
+            logger.error("Error in get_fish_by_tier: %s", e)
+            return self._fallback_fish
 
     def apply_modifier(self, fish_name: str, base_value: int) -> Tuple[str, int]:
         try:
-            for mod_name, mod_data in self.modifiers.items():
-                if random.random() < mod_data['chance']:
-                    new_value = int(base_value * mod_data['multiplier'])
-                    logger.info(f"Applied modifier {mod_name}: {base_value} -> {new_value}")
-                    return f"{mod_data['prefix']} {fish_name} [{mod_name.title()}]", new_value
-            return fish_name, base_value
+            roll = self._rng.random()
+            if not self._mod_cum or roll >= self._mod_cum[-1]:
+                return fish_name, base_value
+
+            mod_name, label, multiplier = self._mod_info[bisect_right(self._mod_cum, roll)]
+            new_value = int(base_value * multiplier)
+            logger.debug("Applied modifier %s: %d -> %d", mod_name, base_value, new_value)
+            return label.format(fish_name), new_value
         except Exception as e:
-            logger.error(f"Error applying modifier: {str(e)}")
+            logger.error("Error applying modifier: %s", e)
             return fish_name, base_value
 
     @commands.command(aliases=["fish"])
@@ -237,59 +314,59 @@ class FishingSystem(commands.Cog):
         try:
             user_id = ctx.author.id
             user_name = ctx.author.display_name
-            logger.info(f"Fishing command initiated by user {user_name}")
+            logger.debug("Fishing command initiated by user %s", user_name)
             
-            data = self.get_user_data(user_id)
-            logger.info(f"User data retrieved: {data}")
+            data = await self.get_user_data(user_id)
+            logger.debug("User data retrieved: %s", data)
 
             if 'rod' not in data:
                 await ctx.reply("You need a fishing rod! Buy one from the store.")
                 return
 
             # Get fish tier
-            tier = random.choices(
-                list(self.tiers.keys()),
-                weights=list(self.tiers.values()),
-                k=1
-            )[0]
-            logger.info(f"Selected tier: {tier}")
+            rand = self._rng.random
+            cum_weights = self._tier_cum_weights
+            tier = self._tier_names[bisect(cum_weights, rand() * cum_weights[-1])]
+            logger.debug("Selected tier: %s", tier)
 
             # Get fish and calculate earnings
-            caught_fish = self.get_fish_by_tier(tier)
-            logger.info(f"Caught fish: {caught_fish}")
+            fish_id = self.get_fish_by_tier(tier)
+            caught_fish = self._fish_names[fish_id]
+            logger.debug("Caught fish: %s", caught_fish)
 
-            min_price, max_price, _ = self.fish_data[caught_fish]
-            base_earnings = random.randint(min_price, max_price)
-            logger.info(f"Base earnings: {base_earnings}")
+            base_earnings = self._rng.randint(self._fish_min[fish_id], self._fish_max[fish_id])
+            logger.debug("Base earnings: %d", base_earnings)
 
             final_fish, final_earnings = self.apply_modifier(caught_fish, base_earnings)
-            logger.info(f"Final fish: {final_fish}, Final earnings: {final_earnings}")
+            logger.debug("Final fish: %s, Final earnings: %d", final_fish, final_earnings)
 
             # Handle special events
             special_event = None
-            if random.random() < 0.10:
-                special_event = random.choice(self.special_events)
-                logger.info(f"Special event triggered: {special_event}")
+            if rand() < 0.10:
+                special_event, kind, bonus = self._rng.choice(self._special_events)
+                logger.debug("Special event triggered: %s", special_event)
                 
-                if "Double" in special_event:
+                if kind == "double":
                     final_earnings *= 2
-                elif "Triple" in special_event:
+                elif kind == "triple":
                     final_earnings *= 3
-                elif "Extra" in special_event:
-                    bonus = int(special_event.split()[special_event.split().index("coins!") - 1])
+                elif kind == "extra":
                     final_earnings += bonus
-                logger.info(f"Earnings after special event: {final_earnings}")
+                logger.debug("Earnings after special event: %d", final_earnings)
 
             # Update user's balance
             try:
-                logger.info(f"final_earnings before relic: {final_earnings}")
-                if "power relic" in data:
-                    final_earnings *= 2
-                    logger.info("user have relic in inv *2 money")
-                self.economy.update_balance(user_id, final_earnings, "fishing", f"Caught {final_fish}")
-                logger.info(f"Balance updated for user {user_id}: +{final_earnings}")
+                logger.debug("final_earnings before relic: %d", final_earnings)
+                if "power_relic" in _owned_relics(data):
+                    final_earnings = int(final_earnings * self.relic_types["power_relic"]["multiplier"])
+                    logger.debug("Power relic applied: %d", final_earnings)
+                # get_user_data has made sure the user row exists
+                await self._run_db(
+                    self.economy.add_earnings, user_id, final_earnings, "fishing", f"Caught {final_fish}"
+                )
+                logger.debug("Balance updated for user %d: +%d", user_id, final_earnings)
             except Exception as e:
-                logger.error(f"Failed to update balance: {str(e)}")
+                logger.error("Failed to update balance: %s", e)
                 await ctx.reply("❌ Error updating balance. Please try again.")
                 return
 
@@ -316,11 +393,30 @@ class FishingSystem(commands.Cog):
             view = FishingView(self, ctx)
             await ctx.reply(embed=embed, view=view) 
         except Exception as e:
-            logger.error(f"Error in fishing command: {traceback.format_exc()}")
+            logger.error("Error in fishing command: %s", traceback.format_exc())
             await ctx.reply(f"❌ An error occurred while fishing. Please try again later.")
 
 
 
+    def _build_fishinfo_fields(self):
+        """The fish/tier data is static, so the !fishinfo fields only need building once."""
+        fields = []
+        for tier, chance in self.tiers.items():
+            tier_fish = [
+                f"{self._fish_names[i]} ({self._fish_min[i]}-{self._fish_max[i]} coins)"
+                for i in self._fish_by_tier.get(tier, ())
+            ]
+            if tier_fish:
+                fields.append((f"{tier.title()} Tier ({chance*100}% chance)", "\n".join(tier_fish), False))
+
+        mod_text = "\n".join([
+            f"{data['prefix']} {name.title()}: {data['chance']*100}% chance for {data['multiplier']}x value"
+            for name, data in self.modifiers.items()
+        ])
+        fields.append(("Special Modifiers", mod_text, False))
+        fields.append(("Special Events", "10% chance for special events to occur while fishing!", False))
+        return fields
+
     @commands.command(name="fishinfo")
     async def fishing_info(self, ctx):
         try:
@@ -330,31 +426,14 @@ class FishingSystem(commands.Cog):
                 color=0x00ff00
             )
 
-            for tier, chance in self.tiers.items():
-                tier_fish = [f"{name} ({data[0]}-{data[1]} coins)"
-                            for name, data in self.fish_data.items()
-                            if data[2] == tier]
-                if tier_fish:
-                    embed.add_field(
-                        name=f"{tier.title()} Tier ({chance*100}% chance)",
-                        value="\n".join(tier_fish),
-                        inline=False
-                    )
-
-            mod_text = "\n".join([
-                f"{data['prefix']} {name.title()}: {data['chance']*100}% chance for {data['multiplier']}x value"
-                for name, data in self.modifiers.items()
-            ])
-            embed.add_field(name="Special Modifiers", value=mod_text, inline=False)
-            embed.add_field(
-                name="Special Events",
-                value="10% chance for special events to occur while fishing!",
-                inline=False
-            )
+            if self._fishinfo_fields is None:
+                self._fishinfo_fields = self._build_fishinfo_fields()
+            for name, value, inline in self._fishinfo_fields:
+                embed.add_field(name=name, value=value, inline=inline)
 
             await ctx.reply(embed=embed)
         except Exception as e:
-            logger.error(f"Error in fishing_info command: {str(e)}")
+            logger.error("Error in fishing_info command: %s", e)
             await ctx.reply("❌ An error occurred while fetching fishing information.")
 
 def setup(bot):
@@ -362,5 +441,5 @@ def setup(bot):
         bot.add_cog(FishingSystem(bot))
         logger.info("FishingSystem cog loaded successfully")
     except Exception as e:
-        logger.error(f"Failed to load FishingSystem cog: {str(e)}")
+        logger.error("Failed to load FishingSystem cog: %s", e)
         raise
@@ -5,16 +5,25 @@ from typing import Optional
 import datetime
 
 class HelpMenu(View):
-    def __init__(self, ctx, bot, commands_per_page=4):
+    def __init__(self, ctx, bot, commands_per_page=4, pages=None):
         super().__init__(timeout=None)
         self.ctx = ctx
+        self.author_id = ctx.author.id
         self.bot = bot
         self.commands_per_page = commands_per_page
         self.current_page = 0
-        
+
+        if pages is None:
+            pages = self.build_pages()
+        self._pages = pages
+        self.max_pages = len(pages)
+        self.previous.disabled = True
+        self.next.disabled = self.max_pages <= 1
+
+    def build_pages(self):
         # Sort and organize commands and groups
         self.all_commands = []
-        for cmd in bot.commands:
+        for cmd in self.bot.commands:
             if isinstance(cmd, commands.Group):
                 # Add group command first
                 self.all_commands.append((cmd, True))  # True indicates it's a group
@@ -25,8 +34,8 @@ class HelpMenu(View):
                 self.all_commands.append((cmd, None))  # None indicates it's a regular command
 
         self.max_pages = (len(self.all_commands) - 1) // self.commands_per_page + 1
-        self.previous.disabled = True
-        self.next.disabled = self.max_pages <= 1
+        # Build every page up front; HelpCog hands them to later menus until the commands change
+        return [self.build_page(page) for page in range(self.max_pages)]
 
     def format_command(self, cmd, is_group):
         if is_group is True:  # Group command
@@ -36,8 +45,8 @@ class HelpMenu(View):
         else:  # Regular command
             return f"📄 `{cmd.name}`"
 
-    async def update_embed(self):
-        start = self.current_page * self.commands_per_page
+    def build_page(self, page):
+        start = page * self.commands_per_page
         end = start + self.commands_per_page
         current_commands = self.all_commands[start:end]
         
@@ -56,26 +65,29 @@ class HelpMenu(View):
                 
             embed.add_field(name=name, value=value, inline=False)
             
-        embed.set_footer(text=f"Page {self.current_page + 1}/{self.max_pages}")
+        embed.set_footer(text=f"Page {page + 1}/{self.max_pages}")
         return embed
 
+    def update_embed(self):
+        return self._pages[self.current_page]
+
     @nextcord.ui.button(label="◀", style=nextcord.ButtonStyle.blurple)
     async def previous(self, button: Button, interaction: nextcord.Interaction):
-        if interaction.user != self.ctx.author:
+        if interaction.user.id != self.author_id:
             return await interaction.response.send_message("This menu is not for you!", ephemeral=True)
         
         self.current_page = max(0, self.current_page - 1)
         self.update_button_states()
-        await interaction.response.edit_message(embed=await self.update_embed(), view=self)
+        await interaction.response.edit_message(embed=self.update_embed(), view=self)
 
     @nextcord.ui.button(label="▶", style=nextcord.ButtonStyle.blurple)
     async def next(self, button: Button, interaction: nextcord.Interaction):
-        if interaction.user != self.ctx.author:
+        if interaction.user.id != self.author_id:
             return await interaction.response.send_message("This menu is not for you!", ephemeral=True)
         
         self.current_page = min(self.max_pages - 1, self.current_page + 1)
         self.update_button_states()
-        await interaction.response.edit_message(embed=await self.update_embed(), view=self)
+        await interaction.response.edit_message(embed=self.update_embed(), view=self)
 
     def update_button_states(self):
         self.previous.disabled = self.current_page == 0
@@ -85,6 +97,18 @@ class HelpCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.bot.remove_command('help')  # Remove default help command
+        # qualified name -> (command, embed); a reloaded cog brings new command objects,
+        # which is what tells us an entry is stale
+        self._help_cache = {}
+        # Pages of the general help menu and the command set they were built from
+        self._menu_pages = None
+        self._menu_commands = None
+
+    def cached_command_help(self, command):
+        cached = self._help_cache.get(command.qualified_name)
+        if cached is None or cached[0] is not command:
+            cached = self._help_cache[command.qualified_name] = (command, self.get_command_help(command))
+        return cached[1]
 
     def get_command_help(self, command):
         embed = nextcord.Embed(
@@ -140,8 +164,12 @@ class HelpCog(commands.Cog):
         """Shows help for all commands or specific commands/groups"""
         # No arguments - show general help
         if not group:
-            menu = HelpMenu(ctx, self.bot)
-            return await ctx.send(embed=await menu.update_embed(), view=menu)
+            current = frozenset(self.bot.all_commands.values())
+            if current != self._menu_commands:
+                self._menu_pages, self._menu_commands = None, current
+            menu = HelpMenu(ctx, self.bot, pages=self._menu_pages)
+            self._menu_pages = menu._pages
+            return await ctx.send(embed=menu.update_embed(), view=menu)
 
         # Find the command/group
         if subcommand:
@@ -160,7 +188,7 @@ class HelpCog(commands.Cog):
                 return await ctx.send(f"❌ Command `{group}` not found.")
 
         # Show help for the specific command/subcommand
-        await ctx.send(embed=self.get_command_help(cmd))
+        await ctx.send(embed=self.cached_command_help(cmd))
 
     @help_command.error
     async def help_command_error(self, ctx, error):
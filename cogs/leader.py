@@ -1,10 +1,14 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord.ui import Button, View
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from utils.eco import EconomySystem
 import humanize
 from datetime import datetime
+from cachetools import TTLCache
+
+# How long a rendered leaderboard page is reused before it's read from the DB again
+PAGE_CACHE_TTL = 30
 
 class LeaderboardView(View):
     def __init__(self, cog, ctx, total_pages, timeout=60):
@@ -13,6 +17,8 @@ class LeaderboardView(View):
         self.ctx = ctx
         self.current_page = 1
         self.total_pages = total_pages
+        # page -> (total, user_id) of the row just above it, for keyset paging
+        self.cursors = {}
         self.create_buttons()
 
     def create_buttons(self):
@@ -54,13 +60,17 @@ class LeaderboardView(View):
         self.next_page.disabled = page == self.total_pages
         self.last_page.disabled = page == self.total_pages
 
-        embed = await self.cog.get_leaderboard_embed(page)
+        embed, cursor = await self.cog.get_leaderboard_embed(page, self.cursors.get(page))
+        if cursor:
+            self.cursors[page + 1] = cursor
         await interaction.response.edit_message(embed=embed, view=self)
 
 class Leaderboard(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.economy = EconomySystem(db_path="db/economy.db")
+        # page -> (embed, cursor); balances move slowly next to how fast people click through pages
+        self._page_cache = TTLCache(maxsize=64, ttl=PAGE_CACHE_TTL)
 
     def format_currency(self, amount: int) -> str:
         """Format currency with appropriate suffixes."""
@@ -72,9 +82,9 @@ class Leaderboard(commands.Cog):
             return f"{amount/1_000:.1f}K"
         return str(amount)
 
-    async def get_user_display(self, user_id: int) -> str:
+    def get_user_display(self, user_id: int, user: Optional[nextcord.User] = None) -> str:
         """Get user display name with fallback."""
-        user = self.bot.get_user(user_id)
+        user = user or self.bot.get_user(user_id)
         if user:
             return str(user)
         return f"Unknown User ({user_id})"
@@ -89,14 +99,31 @@ class Leaderboard(commands.Cog):
             return "🥉"
         return f"`{rank}.`"
 
-    async def get_leaderboard_embed(self, page: int) -> nextcord.Embed:
-        """Generate leaderboard embed with available statistics."""
+    async def get_leaderboard_embed(self, page: int, after: Optional[Tuple[int, int]] = None) -> Tuple[nextcord.Embed, Optional[Tuple[int, int]]]:
+        """Leaderboard page embed and next-page cursor, reused for PAGE_CACHE_TTL seconds."""
+        cached = self._page_cache.get(page)
+        if cached is None:
+            cached = self._page_cache[page] = await self.build_leaderboard_embed(page, after)
+        return cached
+
+    async def build_leaderboard_embed(self, page: int, after: Optional[Tuple[int, int]] = None) -> Tuple[nextcord.Embed, Optional[Tuple[int, int]]]:
+        """
+        Generate leaderboard embed with available statistics.
+
+        `after` is the (total, user_id) of the last row on the previous page; with it the
+        page is read by seeking past that row instead of skipping `offset` rows. Also
+        returns the cursor for the page after this one.
+        """
         limit = 10
         offset = (page - 1) * limit
     
-        # Get leaderboard data using the economy system, with proper LIMIT and OFFSET
-        leaderboard_data = self.economy.get_leaderboard(limit=limit, offset=offset)  # Pass offset here
-        displayed_data = leaderboard_data  # Since we're now only fetching the relevant data, no need to slice it
+        if after:
+            leaderboard_data = self.economy.get_leaderboard_after(*after, limit=limit)
+        else:
+            # No cursor for jumps like the last page, so fall back to LIMIT/OFFSET
+            leaderboard_data = self.economy.get_leaderboard(limit=limit, offset=offset)
+        displayed_data = leaderboard_data
+        cursor = (leaderboard_data[-1][3], leaderboard_data[-1][0]) if leaderboard_data else None
 
         embed = nextcord.Embed(
             title="🏆 Wealth Leaderboard",
@@ -106,23 +133,22 @@ class Leaderboard(commands.Cog):
     
         if not displayed_data:
             embed.description = "No data available."
-            return embed
+            return embed, cursor
     
-        # Calculate total wealth
-        total_wealth = sum(total for _, total in leaderboard_data)
+        # Shares are of everyone's wealth, not just this page's
+        total_wealth = self.economy.total_wealth()
     
-        for rank, (user_id, balance) in enumerate(displayed_data, start=offset + 1):
-            user_display = await self.get_user_display(user_id)
+        # get_user is a plain cache lookup, so resolve the whole page in one go
+        get_user = self.bot.get_user
+        users = {row[0]: get_user(row[0]) for row in displayed_data}
+
+        for rank, (user_id, wallet, bank, balance) in enumerate(displayed_data, start=offset + 1):
+            user_display = self.get_user_display(user_id, users[user_id])
             rank_emoji = self.get_rank_emoji(rank)
     
             # Calculate wealth percentage
             wealth_percentage = (balance / total_wealth * 100) if total_wealth > 0 else 0
     
-            # Get user's balances
-            user_balance = self.economy.get_balance(user_id)
-            wallet = user_balance['wallet']
-            bank = user_balance['bank']
-    
             field_value = (
                 f"💰 Total: `{self.format_currency(balance)}`\n"
                 f"💵 Wallet: `{self.format_currency(wallet)}`\n"
@@ -137,7 +163,7 @@ class Leaderboard(commands.Cog):
             )
     
         embed.set_footer(text=f"Page {page} • Total Wealth: {self.format_currency(total_wealth)}")
-        return embed
+        return embed, cursor
 
     @commands.command(name="leaderboard", aliases=["lb", "rich", "top"])
     async def leaderboard(self, ctx: commands.Context, page: int = 1):
@@ -154,15 +180,17 @@ class Leaderboard(commands.Cog):
             return
 
         # Calculate total pages
-        total_users = len(self.economy.get_leaderboard(1000))  # Get reasonable max for count
+        total_users = self.economy.count_users()
         total_pages = max((total_users - 1) // 10 + 1, 1)
 
         if page > total_pages:
             await ctx.send(f"❌ Invalid page number! Total pages: {total_pages}")
             return
 
-        embed = await self.get_leaderboard_embed(page)
+        embed, cursor = await self.get_leaderboard_embed(page)
         view = LeaderboardView(self, ctx, total_pages)
+        if cursor:
+            view.cursors[page + 1] = cursor
         await ctx.send(embed=embed, view=view)
 
     @commands.command(name="rank", aliases=["wealth"])
@@ -183,7 +211,7 @@ class Leaderboard(commands.Cog):
 
         # Get user's rank
         leaderboard = self.economy.get_leaderboard(1000)  # Get reasonable max
-        rank = next((idx + 1 for idx, (uid, _) in enumerate(leaderboard) if uid == user_id), None)
+        rank = next((idx + 1 for idx, (uid, *_) in enumerate(leaderboard) if uid == user_id), None)
 
         embed = nextcord.Embed(
             title=f"💰 Wealth Statistics for {member or ctx.author}",
@@ -1,15 +1,22 @@
 import os
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Tuple
 from dataclasses import dataclass
 import nextcord
 from nextcord import Interaction, Embed, Color
 from nextcord.ext import commands
 from nextcord.ext.commands import Bot, Context
 from difflib import get_close_matches
+# rapidfuzz is optional: it's a C implementation of the same ratio difflib computes
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
 from colorama import Fore, init
 from utils.config import OWNER_ID
 
 ActionType = Literal["load", "unload", "reload"]
+# Minimum similarity (0-1) for suggest_cog_name to offer a match
+SUGGEST_CUTOFF = 0.6
 init(autoreset=True)
 
 @dataclass
@@ -18,28 +25,64 @@ class CogOperation:
     message: str
     error: Optional[Exception] = None
 
+def _prefix_cog_command(action: ActionType):
+    """Build the !load/!unload/!reload command for `action`."""
+    @commands.command(name=action)
+    async def handler(self, ctx: Context, cog_name: str):
+        result = await self.process_cog_operation(ctx, action, cog_name, ctx.author.id)
+        await ctx.reply(result.message)
+        if result.error:
+            await ctx.reply(f"Error: {result.error}")
+    return handler
+
+def _slash_cog_command(group, action: ActionType):
+    """Build the /cog load|unload|reload subcommand for `action` under `group`."""
+    @group.subcommand(name=action, description=f"{action.capitalize()} a cog")
+    async def handler(self, interaction: Interaction, cog_name: str):
+        result = await self.process_cog_operation(None, action, cog_name, interaction.user.id)
+        await interaction.reply(result.message, ephemeral=True)
+        if result.error:
+            await interaction.followup.send(f"Error: {result.error}")
+    return handler
+
 class CogManager(commands.Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.cogs_directory = "cogs"
+        # (directory mtime, cog names); adding or removing a file bumps the mtime
+        self._cogs_cache: Optional[Tuple[int, List[str]]] = None
 
     def get_available_cogs(self) -> List[str]:
-        if not os.path.exists(self.cogs_directory):
+        try:
+            mtime = os.stat(self.cogs_directory).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        return [
-            f.replace(".py", "")
-            for f in os.listdir(self.cogs_directory)
-            if f.endswith(".py") and not f.startswith("_")
-        ]
+        if self._cogs_cache and self._cogs_cache[0] == mtime:
+            return self._cogs_cache[1]
+
+        with os.scandir(self.cogs_directory) as entries:
+            cogs = [
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+            ]
+        self._cogs_cache = (mtime, cogs)
+        return cogs
+
+    def loaded_cog_names(self) -> List[str]:
+        return [ext[5:] if ext.startswith("cogs.") else ext for ext in self.bot.extensions]
+
+    def unloaded_cog_names(self, loaded: List[str]) -> List[str]:
+        loaded = set(loaded)
+        return [cog for cog in self.get_available_cogs() if cog not in loaded]
 
     def suggest_cog_name(self, cog_name: str, loaded: bool = True) -> Optional[str]:
-        cogs = (
-            [cog.replace("cogs.", "") for cog in self.bot.extensions.keys()]
-            if loaded
-            else self.get_available_cogs()
-        )
-        matches = get_close_matches(cog_name, cogs, n=1)
+        cogs = self.loaded_cog_names() if loaded else self.get_available_cogs()
+        if process is not None:
+            match = process.extractOne(cog_name, cogs, scorer=fuzz.ratio, score_cutoff=SUGGEST_CUTOFF * 100)
+            return match[0] if match else None
+        matches = get_close_matches(cog_name, cogs, n=1, cutoff=SUGGEST_CUTOFF)
         return matches[0] if matches else None
 
     def is_owner(self, user_id: int) -> bool:
@@ -78,32 +121,14 @@ class CogManager(commands.Cog):
                 error=e
             )
 
-    @commands.command(name="load")
-    async def prefix_load_cog(self, ctx: Context, cog_name: str):
-        result = await self.process_cog_operation(ctx, "load", cog_name, ctx.author.id)
-        await ctx.reply(result.message)
-        if result.error:
-            await ctx.reply(f"Error: {result.error}")
-
-    @commands.command(name="unload")
-    async def prefix_unload_cog(self, ctx: Context, cog_name: str):
-        result = await self.process_cog_operation(ctx, "unload", cog_name, ctx.author.id)
-        await ctx.reply(result.message)
-        if result.error:
-            await ctx.reply(f"Error: {result.error}")
-
-    @commands.command(name="reload")
-    async def prefix_reload_cog(self, ctx: Context, cog_name: str):
-        result = await self.process_cog_operation(ctx, "reload", cog_name, ctx.author.id)
-        await ctx.reply(result.message)
-        if result.error:
-            await ctx.reply(f"Error: {result.error}")
+    prefix_load_cog = _prefix_cog_command("load")
+    prefix_unload_cog = _prefix_cog_command("unload")
+    prefix_reload_cog = _prefix_cog_command("reload")
 
     @commands.command(name="cogs")
     async def prefix_list_cogs(self, ctx: Context):
-        loaded_cogs = [cog.replace("cogs.", "") for cog in self.bot.extensions.keys()]
-        available_cogs = self.get_available_cogs()
-        unloaded_cogs = [cog for cog in available_cogs if cog not in loaded_cogs]
+        loaded_cogs = self.loaded_cog_names()
+        unloaded_cogs = self.unloaded_cog_names(loaded_cogs)
 
         embed = Embed(title="Cog Status", color=Color.blue())
         embed.add_field(
@@ -123,32 +148,14 @@ class CogManager(commands.Cog):
     async def cog(self, interaction: Interaction):
         pass
 
-    @cog.subcommand(name="load", description="Load a cog")
-    async def slash_load_cog(self, interaction: Interaction, cog_name: str):
-        result = await self.process_cog_operation(None, "load", cog_name, interaction.user.id)
-        await interaction.reply(result.message, ephemeral=True)
-        if result.error:
-            await interaction.followup.send(f"Error: {result.error}")
-
-    @cog.subcommand(name="unload", description="Unload a cog")
-    async def slash_unload_cog(self, interaction: Interaction, cog_name: str):
-        result = await self.process_cog_operation(None, "unload", cog_name, interaction.user.id)
-        await interaction.reply(result.message, ephemeral=True)
-        if result.error:
-            await interaction.followup.send(f"Error: {result.error}")
-
-    @cog.subcommand(name="reload", description="Reload a cog")
-    async def slash_reload_cog(self, interaction: Interaction, cog_name: str):
-        result = await self.process_cog_operation(None, "reload", cog_name, interaction.user.id)
-        await interaction.reply(result.message, ephemeral=True)
-        if result.error:
-            await interaction.followup.send(f"Error: {result.error}")
+    slash_load_cog = _slash_cog_command(cog, "load")
+    slash_unload_cog = _slash_cog_command(cog, "unload")
+    slash_reload_cog = _slash_cog_command(cog, "reload")
 
     @cog.subcommand(name="list", description="List all cogs")
     async def slash_list_cogs(self, interaction: Interaction):
-        loaded_cogs = [cog.replace("cogs.", "") for cog in self.bot.extensions.keys()]
-        available_cogs = self.get_available_cogs()
-        unloaded_cogs = [cog for cog in available_cogs if cog not in loaded_cogs]
+        loaded_cogs = self.loaded_cog_names()
+        unloaded_cogs = self.unloaded_cog_names(loaded_cogs)
 
         embed = Embed(title="Cog Status", color=Color.blue())
         embed.add_field(
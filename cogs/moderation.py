@@ -6,16 +6,45 @@ from typing import Optional
 from datetime import datetime, timedelta
 from pytimeparse.timeparse import timeparse
 import asyncio
+import queue
+from utils.db import connect
+
+POOL_SIZE = 4
+
+SQL_NEXT_CASE_ID = "SELECT COALESCE(MAX(case_id), 0) + 1 FROM cases WHERE guild_id = ?"
+SQL_GET_LOG_CHANNEL = "SELECT log_channel_id FROM mod_log WHERE guild_id = ?"
+SQL_SET_LOG_CHANNEL = "INSERT OR REPLACE INTO mod_log (guild_id, log_channel_id) VALUES (?, ?)"
+SQL_ADD_CASE = (
+    "INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, duration, timestamp) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_ADD_WARNING = "INSERT INTO warnings (user_id, guild_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?)"
+SQL_GET_CASE = (
+    "SELECT user_id, moderator_id, action, reason, duration, timestamp "
+    "FROM cases WHERE guild_id = ? AND case_id = ?"
+)
 
 class Moderation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.db_path = "db/moderation.db"
+        self._pool = queue.Queue(maxsize=POOL_SIZE)
         self.create_tables()
         
     def get_connection(self):
-        """Get a new database connection."""
-        return sqlite3.connect(self.db_path)
+        """Borrow a pooled database connection, opening a new one if none are idle."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return connect(self.db_path, check_same_thread=False)
+
+    def release_connection(self, conn):
+        """Return a connection to the pool, discarding any uncommitted work."""
+        conn.rollback()
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
     def create_tables(self):
         """Create necessary tables for moderation."""
@@ -57,32 +86,72 @@ class Moderation(commands.Cog):
         except sqlite3.Error as e:
             self.bot.logger.error(f"Database error: {e}")
         finally:
-            conn.close()
+            self.release_connection(conn)
+
+    async def _run_db(self, fn, *args):
+        """Run a blocking database helper in a worker thread."""
+        return await asyncio.to_thread(fn, *args)
 
     def get_next_case_id(self, guild_id):
         """Get the next unique case ID for a specific guild."""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COALESCE(MAX(case_id), 0) + 1 FROM cases WHERE guild_id = ?", (guild_id,))
-            return cursor.fetchone()[0]
+            return conn.execute(SQL_NEXT_CASE_ID, (guild_id,)).fetchone()[0]
         finally:
-            conn.close()
+            self.release_connection(conn)
 
     def get_log_channel(self, guild_id):
         """Fetch the mod log channel for a guild."""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT log_channel_id FROM mod_log WHERE guild_id = ?", (guild_id,))
-            result = cursor.fetchone()
+            result = conn.execute(SQL_GET_LOG_CHANNEL, (guild_id,)).fetchone()
             return result[0] if result else None
         finally:
-            conn.close()
+            self.release_connection(conn)
+
+    def set_log_channel(self, guild_id, channel_id):
+        """Store the mod log channel for a guild."""
+        conn = self.get_connection()
+        try:
+            conn.execute(SQL_SET_LOG_CHANNEL, (guild_id, channel_id))
+            conn.commit()
+        finally:
+            self.release_connection(conn)
+
+    def add_case(self, case_id, guild_id, user_id, moderator_id, action, reason, duration=None):
+        """Record a moderation case."""
+        conn = self.get_connection()
+        try:
+            conn.execute(
+                SQL_ADD_CASE,
+                (case_id, user_id, guild_id, moderator_id, action, reason, duration, datetime.now().isoformat())
+            )
+            conn.commit()
+        finally:
+            self.release_connection(conn)
+
+    def add_warning(self, case_id, guild_id, user_id, moderator_id, reason):
+        """Record a warning together with its case in one transaction."""
+        conn = self.get_connection()
+        try:
+            timestamp = datetime.now().isoformat()
+            conn.execute(SQL_ADD_WARNING, (user_id, guild_id, moderator_id, reason, timestamp))
+            conn.execute(SQL_ADD_CASE, (case_id, user_id, guild_id, moderator_id, "warn", reason, None, timestamp))
+            conn.commit()
+        finally:
+            self.release_connection(conn)
+
+    def get_case(self, guild_id, case_id):
+        """Fetch a single case row."""
+        conn = self.get_connection()
+        try:
+            return conn.execute(SQL_GET_CASE, (guild_id, case_id)).fetchone()
+        finally:
+            self.release_connection(conn)
 
     async def log_action(self, guild, action, user, moderator, reason=None, duration=None, file=None, case_id=None):
         """Log moderation actions to the designated channel."""
-        log_channel_id = self.get_log_channel(guild.id)
+        log_channel_id = await self._run_db(self.get_log_channel, guild.id)
         if not log_channel_id:
             return
         log_channel = guild.get_channel(log_channel_id)
@@ -159,14 +228,8 @@ class Moderation(commands.Cog):
         interaction: nextcord.Interaction,
         channel: nextcord.TextChannel = SlashOption(description="The channel to set as mod log")
     ):
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT OR REPLACE INTO mod_log (guild_id, log_channel_id) VALUES (?, ?)",
-                (interaction.guild.id, channel.id)
-            )
-            conn.commit()
+            await self._run_db(self.set_log_channel, interaction.guild.id, channel.id)
 
             embed = nextcord.Embed(
                 title="Moderation Log Channel Set",
@@ -181,8 +244,6 @@ class Moderation(commands.Cog):
                 color=nextcord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
-        finally:
-            conn.close()
 
     @nextcord.slash_command(name="warn", description="Warn a user.")
     @commands.has_permissions(moderate_members=True)
@@ -201,23 +262,12 @@ class Moderation(commands.Cog):
             await interaction.response.send_message("You cannot warn users with a higher or equal role than yours.", ephemeral=True)
             return
             
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            case_id = self.get_next_case_id(interaction.guild.id)
-
-            cursor.execute(
-                "INSERT INTO warnings (user_id, guild_id, moderator_id, reason, timestamp) VALUES (?, ?, ?, ?, ?)",
-                (user.id, interaction.guild.id, interaction.user.id, reason, datetime.now().isoformat())
+            case_id = await self._run_db(self.get_next_case_id, interaction.guild.id)
+            await self._run_db(
+                self.add_warning, case_id, interaction.guild.id, user.id, interaction.user.id, reason
             )
 
-            cursor.execute(
-                "INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (case_id, user.id, interaction.guild.id, interaction.user.id, "warn", reason, datetime.now().isoformat())
-            )
-
-            conn.commit()
-
             embed = nextcord.Embed(
                 title="User Warned",
                 description=f"{user.mention} has been warned.",
@@ -233,8 +283,6 @@ class Moderation(commands.Cog):
             await interaction.response.send_message(f"Database error: {e}", ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
-        finally:
-            conn.close()
 
     @nextcord.slash_command(name="ban", description="Ban a user.")
     @commands.has_permissions(ban_members=True)
@@ -256,10 +304,8 @@ class Moderation(commands.Cog):
             
         parsed_duration = timeparse(duration) if duration else None
         
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            case_id = self.get_next_case_id(interaction.guild.id)
+            case_id = await self._run_db(self.get_next_case_id, interaction.guild.id)
 
             # First send DM to user before banning
             await self.send_dm(
@@ -275,11 +321,10 @@ class Moderation(commands.Cog):
                 # Temporary ban
                 try:
                     await user.ban(reason=reason)
-                    cursor.execute("""
-                        INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, duration, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (case_id, user.id, interaction.guild.id, interaction.user.id, "temporary ban", reason, duration, datetime.now().isoformat()))
-                    conn.commit()
+                    await self._run_db(
+                        self.add_case, case_id, interaction.guild.id, user.id, interaction.user.id,
+                        "temporary ban", reason, duration
+                    )
 
                     embed = nextcord.Embed(
                         title="User Temporarily Banned",
@@ -304,11 +349,10 @@ class Moderation(commands.Cog):
                 # Permanent ban
                 try:
                     await user.ban(reason=reason)
-                    cursor.execute("""
-                        INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, duration, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (case_id, user.id, interaction.guild.id, interaction.user.id, "permanent ban", reason, "Permanent", datetime.now().isoformat()))
-                    conn.commit()
+                    await self._run_db(
+                        self.add_case, case_id, interaction.guild.id, user.id, interaction.user.id,
+                        "permanent ban", reason, "Permanent"
+                    )
 
                     embed = nextcord.Embed(
                         title="User Permanently Banned",
@@ -327,8 +371,6 @@ class Moderation(commands.Cog):
                     await interaction.response.send_message(f"Failed to ban user: {str(e)}", ephemeral=True)
         except sqlite3.Error as e:
             await interaction.response.send_message(f"Database error: {e}", ephemeral=True)
-        finally:
-            conn.close()
             
     async def schedule_unban(self, guild, user, duration_seconds, case_id):
         """Handle scheduled unbans without blocking the bot."""
@@ -391,20 +433,17 @@ class Moderation(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            case_id = self.get_next_case_id(interaction.guild.id)
+            case_id = await self._run_db(self.get_next_case_id, interaction.guild.id)
 
             try:
                 until = datetime.now() + timedelta(seconds=parsed_duration)
                 await user.edit(timeout=nextcord.utils.utcnow()+timedelta(seconds=parsed_duration), reason=reason)
                 
-                cursor.execute("""
-                    INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, duration, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (case_id, user.id, interaction.guild.id, interaction.user.id, "timeout", reason, duration, datetime.now().isoformat()))
-                conn.commit()
+                await self._run_db(
+                    self.add_case, case_id, interaction.guild.id, user.id, interaction.user.id,
+                    "timeout", reason, duration
+                )
 
                 embed = nextcord.Embed(
                     title="User Timed Out",
@@ -423,8 +462,6 @@ class Moderation(commands.Cog):
                 await interaction.response.send_message(f"Failed to timeout user: {str(e)}", ephemeral=True)
         except sqlite3.Error as e:
             await interaction.response.send_message(f"Database error: {e}", ephemeral=True)
-        finally:
-            conn.close()
 
     @nextcord.slash_command(name="kick", description="Kick a user.")
     @commands.has_permissions(kick_members=True)
@@ -443,20 +480,17 @@ class Moderation(commands.Cog):
             await interaction.response.send_message("You cannot kick users with a higher or equal role than yours.", ephemeral=True)
             return
 
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            case_id = self.get_next_case_id(interaction.guild.id)
+            case_id = await self._run_db(self.get_next_case_id, interaction.guild.id)
 
             # Send DM first before kicking
             await self.send_dm(user, "Kick", reason, file=proof, case_id=case_id)
             
             try:
-                cursor.execute("""
-                    INSERT INTO cases (case_id, user_id, guild_id, moderator_id, action, reason, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (case_id, user.id, interaction.guild.id, interaction.user.id, "kick", reason, datetime.now().isoformat()))
-                conn.commit()
+                await self._run_db(
+                    self.add_case, case_id, interaction.guild.id, user.id, interaction.user.id,
+                    "kick", reason
+                )
 
                 await user.kick(reason=reason)
                 embed = nextcord.Embed(
@@ -475,8 +509,6 @@ class Moderation(commands.Cog):
                 await interaction.response.send_message(f"Failed to kick user: {str(e)}", ephemeral=True)
         except sqlite3.Error as e:
             await interaction.response.send_message(f"Database error: {e}", ephemeral=True)
-        finally:
-            conn.close()
             
     @nextcord.slash_command(name="case", description="Look up case information.")
     @commands.has_permissions(moderate_members=True)
@@ -485,16 +517,8 @@ class Moderation(commands.Cog):
         interaction: nextcord.Interaction,
         case_id: int = SlashOption(description="The case ID to look up")
     ):
-        conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT user_id, moderator_id, action, reason, duration, timestamp 
-                FROM cases 
-                WHERE guild_id = ? AND case_id = ?
-            """, (interaction.guild.id, case_id))
-            
-            result = cursor.fetchone()
+            result = await self._run_db(self.get_case, interaction.guild.id, case_id)
             if not result:
                 await interaction.response.send_message(f"Case #{case_id} not found.", ephemeral=True)
                 return
@@ -554,13 +578,11 @@ class Moderation(commands.Cog):
             await interaction.response.send_message(f"Database error: {e}", ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
-        finally:
-            conn.close()
 
     def cog_unload(self):
-        """Close the database connection when the cog is unloaded."""
-        # No need to close a connection here as we're using per-method connections now
-        pass
+        """Close pooled database connections when the cog is unloaded."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
 
 def setup(bot):
     bot.add_cog(Moderation(bot))
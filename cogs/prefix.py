@@ -5,6 +5,7 @@ import os
 import asyncio
 from typing import List, Dict, Set
 import json
+from utils.db import connect
 
 class DynamicPrefix(commands.Cog):
     def __init__(self, bot):
@@ -12,6 +13,7 @@ class DynamicPrefix(commands.Cog):
         # Cache structure: {guild_id: set(prefixes)}
         self.prefix_cache: Dict[int, Set[str]] = {}
         self.default_prefix = "!"
+        self.conn = None
         self.setup_database()
         self.load_prefixes()
         
@@ -24,28 +26,23 @@ class DynamicPrefix(commands.Cog):
         if not os.path.exists('db'):
             os.makedirs('db')
             
-        # Connect to database and create table if it doesn't exist
-        with sqlite3.connect('db/prefixes.db') as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        # One connection for the cog's lifetime; `with self.conn` only wraps a transaction
+        self.conn = connect('db/prefixes.db')
+        with self.conn:
+            self.conn.execute('''
             CREATE TABLE IF NOT EXISTS guild_prefixes (
                 guild_id INTEGER,
                 prefix TEXT,
                 PRIMARY KEY (guild_id, prefix)
             )
             ''')
-            conn.commit()
     
     def load_prefixes(self):
         """Load all prefixes from the database into the cache"""
-        with sqlite3.connect('db/prefixes.db') as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT guild_id, prefix FROM guild_prefixes')
-            
-            for guild_id, prefix in cursor.fetchall():
-                if guild_id not in self.prefix_cache:
-                    self.prefix_cache[guild_id] = set()
-                self.prefix_cache[guild_id].add(prefix)
+        for guild_id, prefix in self.conn.execute('SELECT guild_id, prefix FROM guild_prefixes'):
+            if guild_id not in self.prefix_cache:
+                self.prefix_cache[guild_id] = set()
+            self.prefix_cache[guild_id].add(prefix)
     
     async def get_prefix(self, bot, message):
         """Dynamic prefix getter for the bot"""
@@ -67,7 +64,7 @@ class DynamicPrefix(commands.Cog):
     def add_prefix_to_db(self, guild_id: int, prefix: str) -> bool:
         """Add a prefix to the database if it doesn't exist already"""
         try:
-            with sqlite3.connect('db/prefixes.db') as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
                 
                 # Check if prefix already exists
@@ -79,7 +76,6 @@ class DynamicPrefix(commands.Cog):
                 # Add the new prefix
                 cursor.execute('INSERT INTO guild_prefixes (guild_id, prefix) VALUES (?, ?)',
                               (guild_id, prefix))
-                conn.commit()
                 
                 # Update cache
                 if guild_id not in self.prefix_cache:
@@ -93,11 +89,10 @@ class DynamicPrefix(commands.Cog):
     def remove_prefix_from_db(self, guild_id: int, prefix: str) -> bool:
         """Remove a specific prefix from the database"""
         try:
-            with sqlite3.connect('db/prefixes.db') as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM guild_prefixes WHERE guild_id = ? AND prefix = ?', 
                              (guild_id, prefix))
-                conn.commit()
                 
                 # If we actually deleted something
                 if cursor.rowcount > 0:
@@ -162,10 +157,8 @@ class DynamicPrefix(commands.Cog):
     async def clearprefixes(self, ctx):
         """Remove all custom prefixes for this server (Admin only)"""
         try:
-            with sqlite3.connect('db/prefixes.db') as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM guild_prefixes WHERE guild_id = ?', (ctx.guild.id,))
-                conn.commit()
+            with self.conn as conn:
+                conn.execute('DELETE FROM guild_prefixes WHERE guild_id = ?', (ctx.guild.id,))
                 
                 # Clear the cache for this guild
                 if ctx.guild.id in self.prefix_cache:
@@ -196,10 +189,8 @@ class DynamicPrefix(commands.Cog):
     async def on_guild_remove(self, guild):
         """Clean up prefixes when bot leaves a guild"""
         try:
-            with sqlite3.connect('db/prefixes.db') as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM guild_prefixes WHERE guild_id = ?', (guild.id,))
-                conn.commit()
+            with self.conn as conn:
+                conn.execute('DELETE FROM guild_prefixes WHERE guild_id = ?', (guild.id,))
                 
             # Remove from cache
             if guild.id in self.prefix_cache:
@@ -207,12 +198,9 @@ class DynamicPrefix(commands.Cog):
         except sqlite3.Error as e:
             print(f"Error cleaning up prefixes for guild {guild.id}: {e}")
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Process commands with the dynamic prefix"""
-        # Already handled by the bot's command processing
-        # This is here for any additional prefix-related processing if needed
-        pass
+    def cog_unload(self):
+        if self.conn:
+            self.conn.close()
 
 def setup(bot):
     bot.add_cog(DynamicPrefix(bot))
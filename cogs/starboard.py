@@ -1,17 +1,22 @@
 import nextcord
 from nextcord.ext import commands
-import sqlite3
 from typing import Optional
 import re
 import aiohttp
+from cachetools import TTLCache
+from utils.db import connect
+
+_MISSING = object()
 
 class StarboardCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.conn = sqlite3.connect('db/starboard.db')
+        self.conn = connect('db/starboard.db')
         self.create_tables()
-        # Supported media extensions
-        self.media_extensions = ['.gif', '.png', '.jpg', '.jpeg', '.webp', '.webm', '.mp4', '.mov']
+        # guild_id -> starboard_config row (or None), so reactions skip SQLite
+        self._config_cache = TTLCache(maxsize=512, ttl=300)
+        # Supported media extensions (a tuple so str.endswith can test them all at once)
+        self.media_extensions = ('.gif', '.png', '.jpg', '.jpeg', '.webp', '.webm', '.mp4', '.mov')
 
     def create_tables(self):
         """Initialize database tables for starboard system."""
@@ -38,6 +43,16 @@ class StarboardCog(commands.Cog):
         ''')
         self.conn.commit()
 
+    def get_config(self, guild_id: int) -> Optional[tuple]:
+        """Fetch a guild's starboard config, caching misses as well as hits."""
+        config = self._config_cache.get(guild_id, _MISSING)
+        if config is _MISSING:
+            config = self.conn.execute(
+                'SELECT * FROM starboard_config WHERE guild_id = ?', (guild_id,)
+            ).fetchone()
+            self._config_cache[guild_id] = config
+        return config
+
     def extract_media_url(self, message):
         """Extract media URL from message attachments or links."""
         # Check attachments first
@@ -47,7 +62,7 @@ class StarboardCog(commands.Cog):
 
         # Check for media links in message content
         for word in message.content.split():
-            if any(word.lower().endswith(ext) for ext in self.media_extensions):
+            if word.lower().endswith(self.media_extensions):
                 return word
 
         return None
@@ -73,6 +88,7 @@ class StarboardCog(commands.Cog):
             VALUES (?, ?, ?, ?)
         ''', (interaction.guild.id, channel.id, threshold, allow_self_stars))
         self.conn.commit()
+        self._config_cache[interaction.guild.id] = (interaction.guild.id, channel.id, threshold, allow_self_stars)
 
         embed = nextcord.Embed(
             title="Starboard Configuration",
@@ -88,9 +104,7 @@ class StarboardCog(commands.Cog):
     @starboard.subcommand(name="config", description="View current starboard configuration")
     async def starboard_config(self, interaction: nextcord.Interaction):
         """Display the current starboard configuration."""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM starboard_config WHERE guild_id = ?', (interaction.guild.id,))
-        config = cursor.fetchone()
+        config = self.get_config(interaction.guild.id)
 
         if not config:
             await interaction.response.send_message(
@@ -116,13 +130,11 @@ class StarboardCog(commands.Cog):
     async def on_reaction_add(self, reaction: nextcord.Reaction, user: nextcord.Member):
         """Handle star reactions and manage starboard messages."""
         # Skip if the reaction is not a star
-        if str(reaction.emoji) != "⭐":
+        if str(reaction.emoji) != "⭐" or reaction.message.guild is None:
             return
 
         # Fetch starboard configuration
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM starboard_config WHERE guild_id = ?', (reaction.message.guild.id,))
-        config = cursor.fetchone()
+        config = self.get_config(reaction.message.guild.id)
 
         if not config:
             return  # No starboard setup for this guild
@@ -137,6 +149,7 @@ class StarboardCog(commands.Cog):
         # Check star count
         if reaction.count >= threshold:
             # Check if message is already in starboard
+            cursor = self.conn.cursor()
             cursor.execute('SELECT * FROM starred_messages WHERE message_id = ?', (reaction.message.id,))
             existing_star = cursor.fetchone()
 
@@ -159,7 +172,7 @@ class StarboardCog(commands.Cog):
             if media_url:
                 # Check if URL is an image or video
                 lower_url = media_url.lower()
-                if any(lower_url.endswith(ext) for ext in ['.gif', '.png', '.jpg', '.jpeg', '.webp']):
+                if lower_url.endswith(('.gif', '.png', '.jpg', '.jpeg', '.webp')):
                     embed.set_image(url=media_url)
                 else:
                     embed.set_image(media_url)
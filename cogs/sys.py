@@ -3,11 +3,11 @@ import time
 import psutil
 import datetime
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from collections import namedtuple
 
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +26,7 @@ SystemStats = namedtuple('SystemStats', ['cpu', 'memory', 'disk', 'network', 'bo
 class SystemInfoConfig:
     """Configuration for SystemInfo cog"""
     REFRESH_RATE = 60  # seconds
+    SAMPLE_RATE = 5  # seconds between background stats samples
     EMBED_COLORS = {
         "main": 0x2b2d31,      # Dark theme discord color
         "success": 0x57F287,   # Green
@@ -56,26 +57,36 @@ class SystemInfo(commands.Cog):
         self.bot = bot
         self._last_stats: Dict[str, Any] = {}
         self._start_time = time.time()
+        # None of these change while the bot is running
+        self._boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
+        self._python_version = platform.python_version()
+        self._os_name = f"{platform.system()} {platform.release()}"
+        self._stats_snapshot: Optional[SystemStats] = None
+        # The first non-blocking cpu_percent() call only sets the baseline
+        psutil.cpu_percent(interval=None)
+        self._sample_stats.start()
         logger.info("SystemInfo cog initialized")
 
+    def cog_unload(self):
+        self._sample_stats.cancel()
+
+    @tasks.loop(seconds=SystemInfoConfig.SAMPLE_RATE)
+    async def _sample_stats(self):
+        """Refresh the stats snapshot in the background so commands never read /proc."""
+        self._stats_snapshot = self._get_system_stats()
+
     def _get_system_stats(self) -> SystemStats:
         """Collect system statistics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            network = psutil.net_io_counters()
-            boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
-
             return SystemStats(
-                cpu=cpu_percent,
-                memory=memory,
-                disk=disk,
-                network=network,
-                boot_time=boot_time
+                cpu=psutil.cpu_percent(interval=None),
+                memory=psutil.virtual_memory(),
+                disk=psutil.disk_usage('/'),
+                network=psutil.net_io_counters(),
+                boot_time=self._boot_time
             )
         except Exception as e:
-            logger.error(f"Error collecting system stats: {str(e)}")
+            logger.error("Error collecting system stats: %s", e)
             return None
 
     def _format_uptime(self, seconds: float) -> str:
@@ -129,10 +140,10 @@ class SystemInfo(commands.Cog):
             )
 
             await message.edit(content=None, embed=embed)
-            logger.info(f"Ping command executed - WS: {ws_latency}ms, API: {duration:.2f}ms")
+            logger.info("Ping command executed - WS: %sms, API: %.2fms", ws_latency, duration)
 
         except Exception as e:
-            logger.error(f"Error in ping command: {str(e)}")
+            logger.error("Error in ping command: %s", e)
             await ctx.send("❌ An error occurred while checking ping.")
 
     @commands.command(aliases=['sys', 'system', 'about'])
@@ -140,7 +151,7 @@ class SystemInfo(commands.Cog):
         """Display detailed system statistics and bot information."""
         try:
             async with ctx.typing():
-                stats = self._get_system_stats()
+                stats = self._stats_snapshot or self._get_system_stats()
 
                 if not stats:
                     raise Exception("Failed to collect system statistics")
@@ -156,9 +167,9 @@ class SystemInfo(commands.Cog):
                 # Bot Information
                 bot_info = (
                     f"{SystemInfoConfig.EMOJIS['uptime']} **Uptime:** {self._format_uptime(time.time() - self._start_time)}\n"
-                    f"{SystemInfoConfig.EMOJIS['python']} **Python:** v{platform.python_version()}\n"
+                    f"{SystemInfoConfig.EMOJIS['python']} **Python:** v{self._python_version}\n"
                     f"{SystemInfoConfig.EMOJIS['nextcord']} **Nextcord:** v{nextcord.__version__}\n"
-                    f"{SystemInfoConfig.EMOJIS['os']} **OS:** {platform.system()} {platform.release()}"
+                    f"{SystemInfoConfig.EMOJIS['os']} **OS:** {self._os_name}"
                 )
                 embed.add_field(name="Bot Information", value=bot_info, inline=False)
 
@@ -202,10 +213,10 @@ class SystemInfo(commands.Cog):
                 )
 
                 await ctx.send(embed=embed)
-                logger.info(f"Stats command executed by {ctx.author}")
+                logger.info("Stats command executed by %s", ctx.author)
 
         except Exception as e:
-            logger.error(f"Error in stats command: {str(e)}")
+            logger.error("Error in stats command: %s", e)
             error_embed = nextcord.Embed(
                 title="❌ Error",
                 description="An error occurred while fetching system statistics.",
@@ -246,10 +257,10 @@ class SystemInfo(commands.Cog):
             )
 
             await ctx.send(embed=embed)
-            logger.info(f"Uptime command executed by {ctx.author}")
+            logger.info("Uptime command executed by %s", ctx.author)
 
         except Exception as e:
-            logger.error(f"Error in uptime command: {str(e)}")
+            logger.error("Error in uptime command: %s", e)
             await ctx.send("❌ An error occurred while fetching uptime information.")
 
 def setup(bot: commands.Bot):
@@ -1,6 +1,6 @@
 import nextcord
 from nextcord.ext import commands
-import json
+import orjson
 import os
 import difflib
 import asyncio
@@ -8,26 +8,61 @@ from typing import Dict, List, Optional
 
 # Tag data file
 TAG_FILE = "tags.json"
+# Edits arriving within this many seconds are written to disk together
+SAVE_DELAY = 2.0
 
 # Initialize tags file if it doesn't exist
 if not os.path.exists(TAG_FILE):
-    with open(TAG_FILE, "w") as f:
-        json.dump({}, f)
+    with open(TAG_FILE, "wb") as f:
+        f.write(b"{}")
+
+# In-memory copy of the tag file; the file itself is only written by the debounced saver
+_tags: Optional[Dict[str, str]] = None
+_save_task: Optional[asyncio.Task] = None
 
 
 def load_tags() -> Dict[str, str]:
-    """Load tags from the JSON file."""
-    try:
-        with open(TAG_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return {}
+    """Load tags, reading the JSON file only on first use."""
+    global _tags
+    if _tags is None:
+        try:
+            with open(TAG_FILE, "rb") as f:
+                _tags = orjson.loads(f.read())
+        except (orjson.JSONDecodeError, FileNotFoundError):
+            _tags = {}
+    return _tags
+
+
+def _write_tags(data: bytes) -> None:
+    # Write to a temp file and swap it in, so a crash mid-write can't leave a truncated file
+    tmp_file = TAG_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, TAG_FILE)
+
+
+async def _save_later() -> None:
+    global _save_task
+    await asyncio.sleep(SAVE_DELAY)
+    _save_task = None
+    await asyncio.to_thread(_write_tags, orjson.dumps(_tags, option=orjson.OPT_INDENT_2))
 
 
 def save_tags(tags: Dict[str, str]) -> None:
-    """Save tags to the JSON file."""
-    with open(TAG_FILE, "w") as f:
-        json.dump(tags, f, indent=4)
+    """Save tags, scheduling a write of the JSON file off the event loop."""
+    global _tags, _save_task
+    _tags = tags
+    if _save_task is None:
+        _save_task = asyncio.create_task(_save_later())
+
+
+def flush_tags() -> None:
+    """Write any pending tag changes immediately."""
+    global _save_task
+    if _save_task is not None:
+        _save_task.cancel()
+        _save_task = None
+        _write_tags(orjson.dumps(_tags, option=orjson.OPT_INDENT_2))
 
 
 class TagManagementView(nextcord.ui.View):
@@ -230,6 +265,9 @@ class TagSystem(commands.Cog):
         # Dictionary to store active suggestion messages
         self.active_suggestions = {}
 
+    def cog_unload(self):
+        flush_tags()
+
     @commands.group(name="tag", invoke_without_command=True)
     async def tag(self, ctx: commands.Context, tag_name: str = None):
         """Display a tag or list all tags if no tag name is provided."""
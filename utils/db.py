@@ -0,0 +1,17 @@
+import sqlite3
+
+# Applied to every connection we open. WAL lets readers run alongside a writer
+# and, with synchronous=NORMAL, a commit costs one fsync instead of two.
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-32768;
+"""
+
+def connect(db_path: str, **kwargs) -> sqlite3.Connection:
+    """Open a SQLite connection with the shared pragma stack applied."""
+    conn = sqlite3.connect(db_path, **kwargs)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
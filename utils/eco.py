@@ -2,6 +2,10 @@ import sqlite3
 from typing import Optional, List, Dict, Tuple
 from datetime import datetime, timedelta
 import json
+from utils.db import connect
+
+# Creates the user's row with the starting balance, or does nothing if it's already there
+SQL_ENSURE_USER = "INSERT OR IGNORE INTO users (user_id, balance) VALUES (?, ?)"
 
 class EconomySystem:
     """
@@ -21,7 +25,9 @@ class EconomySystem:
             db_path: Path to SQLite database file
             starting_balance: Amount given to new users
         """
-        self.conn = sqlite3.connect(db_path)
+        # check_same_thread=False so cogs can hand calls to a worker thread;
+        # callers must still keep to one thread at a time per instance
+        self.conn = connect(db_path, check_same_thread=False)
         self.starting_balance = starting_balance
         self.create_tables()
         self._load_config()
@@ -81,6 +87,12 @@ class EconomySystem:
                 )
             """)
 
+            # Leaderboard order, so its pages are an index range scan instead of a sort
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_users_total
+                ON users ((balance + bank_balance) DESC, user_id DESC)
+            """)
+
     # === Basic Economy Functions ===
     
     def add_user(self, user_id: int) -> bool:
@@ -160,6 +172,33 @@ class EconomySystem:
             
         return self.get_balance(user_id)
 
+    def add_earnings(self, user_id: int, amount: int,
+                     transaction_type: str = "generic",
+                     description: str = "Update") -> None:
+        """
+        Credit a non-negative amount to the wallet of an existing user.
+
+        Unlike update_balance this needs no funds check, so the balance
+        change and its transaction record go out as one transaction with
+        no reads before or after.
+        """
+        if amount < 0:
+            raise ValueError("Earnings must be non-negative")
+
+        with self.conn:
+            cursor = self.conn.execute("""
+                UPDATE users
+                SET balance = balance + ?, last_active = CURRENT_TIMESTAMP
+                WHERE user_id = ?
+            """, (amount, user_id))
+            if cursor.rowcount == 0:
+                raise ValueError("Unknown user")
+
+            self.conn.execute("""
+                INSERT INTO transactions (user_id, amount, type, description)
+                VALUES (?, ?, ?, ?)
+            """, (user_id, amount, transaction_type, description))
+
     # === Banking Functions ===
     
     def deposit(self, user_id: int, amount: int) -> Dict[str, int]:
@@ -196,6 +235,41 @@ class EconomySystem:
             
         return self.get_balance(user_id)
 
+    def deposit_all(self, user_id: int) -> Tuple[int, Dict[str, int]]:
+        """Move the whole wallet to the bank. Returns (amount moved, new balance)."""
+        with self.conn:
+            # IMMEDIATE takes the write lock up front, so the amount we read is the amount we move
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(SQL_ENSURE_USER, (user_id, self.starting_balance))
+            moved = self.conn.execute(
+                "SELECT balance FROM users WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+            wallet, bank = self.conn.execute("""
+                UPDATE users
+                SET bank_balance = bank_balance + balance,
+                    balance = 0
+                WHERE user_id = ?
+                RETURNING balance, bank_balance
+            """, (user_id,)).fetchall()[0]
+        return moved, {"wallet": wallet, "bank": bank}
+
+    def withdraw_all(self, user_id: int) -> Tuple[int, Dict[str, int]]:
+        """Move the whole bank balance to the wallet. Returns (amount moved, new balance)."""
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute(SQL_ENSURE_USER, (user_id, self.starting_balance))
+            moved = self.conn.execute(
+                "SELECT bank_balance FROM users WHERE user_id = ?", (user_id,)
+            ).fetchone()[0]
+            wallet, bank = self.conn.execute("""
+                UPDATE users
+                SET balance = balance + bank_balance,
+                    bank_balance = 0
+                WHERE user_id = ?
+                RETURNING balance, bank_balance
+            """, (user_id,)).fetchall()[0]
+        return moved, {"wallet": wallet, "bank": bank}
+
     # === Daily Rewards ===
     
     def claim_daily(self, user_id: int) -> Dict[str, any]:
@@ -357,14 +431,33 @@ class EconomySystem:
     # === Leaderboard ===
     
     def get_leaderboard(self, limit: int = 10, offset: int = 0) -> List[Dict]:
-        """Get top users by total wealth (wallet + bank), with pagination."""
+        """Get top users by total wealth as (user_id, wallet, bank, total) rows, with pagination."""
         return self.conn.execute("""
-            SELECT user_id, balance + bank_balance as total
+            SELECT user_id, balance, bank_balance, balance + bank_balance as total
             FROM users
-            ORDER BY total DESC
+            ORDER BY total DESC, user_id DESC
             LIMIT ? OFFSET ?
         """, (limit, offset)).fetchall()    
 
+    def get_leaderboard_after(self, last_total: int, last_user_id: int, limit: int = 10) -> List[Dict]:
+        """Get the leaderboard rows ranked below (last_total, last_user_id), without an OFFSET scan."""
+        return self.conn.execute("""
+            SELECT user_id, balance, bank_balance, balance + bank_balance as total
+            FROM users
+            WHERE balance + bank_balance <= ?1
+              AND (balance + bank_balance, user_id) < (?1, ?2)
+            ORDER BY total DESC, user_id DESC
+            LIMIT ?3
+        """, (last_total, last_user_id, limit)).fetchall()
+
+    def total_wealth(self) -> int:
+        """Combined wallet and bank balance of every user."""
+        return self.conn.execute("SELECT COALESCE(SUM(balance + bank_balance), 0) FROM users").fetchone()[0]
+
+    def count_users(self) -> int:
+        """Number of users on the leaderboard."""
+        return self.conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
 # === Example Usage ===
 if __name__ == "__main__":
     # Initialize system
@@ -0,0 +1,56 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+class SemanticCache:
+    """
+    Fixed-size store of (question, answer) pairs searchable by embedding similarity.
+
+    Vectors are kept in one preallocated matrix so a lookup is a single
+    matrix-vector product. Embeddings must be L2-normalized, which makes the
+    dot product equal to cosine similarity.
+    """
+
+    def __init__(self, dim: int, maxsize: int = 2048, threshold: float = 0.92):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._vectors = np.zeros((maxsize, dim), dtype=np.float32)
+        self._last_used = np.zeros(maxsize, dtype=np.int64)
+        self._entries: List[Tuple[str, str]] = []
+        self._clock = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _touch(self, index: int):
+        self._clock += 1
+        self._last_used[index] = self._clock
+
+    def lookup(self, vector: np.ndarray) -> Optional[str]:
+        """Return the cached answer closest to `vector`, if it is similar enough."""
+        count = len(self._entries)
+        if not count:
+            return None
+
+        sims = self._vectors[:count] @ vector
+        best = int(sims.argmax())
+        if sims[best] < self.threshold:
+            return None
+
+        self._touch(best)
+        return self._entries[best][1]
+
+    def add(self, question: str, answer: str, vector: np.ndarray) -> Optional[str]:
+        """Store an entry, returning the question it evicted (if any)."""
+        evicted = None
+        if len(self._entries) < self.maxsize:
+            index = len(self._entries)
+            self._entries.append((question, answer))
+        else:
+            index = int(self._last_used.argmin())
+            evicted = self._entries[index][0]
+            self._entries[index] = (question, answer)
+
+        self._vectors[index] = vector
+        self._touch(index)
+        return evicted